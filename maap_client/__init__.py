@@ -1,25 +1,56 @@
 """MAAP Client - ESA MAAP data access."""
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
 
 # Library-friendly logging: prevents "No handler found" warnings when used as a library
 logging.getLogger("maap_client").addHandler(logging.NullHandler())
 
-from maap_client.catalog import Catalog
-from maap_client.catalog_build import BaselineInfo
-from maap_client.client import MaapClient
-from maap_client.config import MaapConfig
 from maap_client.constants import DEFAULT_COLLECTIONS, __version__
 from maap_client.exceptions import (
     AuthenticationError,
     InvalidRequestError,
     MaapError,
 )
-from maap_client.types import DownloadResult, GranuleInfo, SearchResult, SyncResult
+
+if TYPE_CHECKING:
+    from maap_client.catalog import Catalog
+    from maap_client.catalog_build import BaselineInfo
+    from maap_client.client import MaapClient
+    from maap_client.config import MaapConfig
+    from maap_client.types import DownloadResult, GranuleInfo, SearchResult, SyncResult
 
 # Backward compatibility alias
 COLLECTIONS = DEFAULT_COLLECTIONS
 
+# Public names loaded on first access (PEP 562), so importing a submodule
+# such as maap_client.cli doesn't pull in requests and the STAC client
+_LAZY_ATTRS = {
+    "Catalog": "maap_client.catalog",
+    "BaselineInfo": "maap_client.catalog_build",
+    "MaapClient": "maap_client.client",
+    "MaapConfig": "maap_client.config",
+    "DownloadResult": "maap_client.types",
+    "GranuleInfo": "maap_client.types",
+    "SearchResult": "maap_client.types",
+    "SyncResult": "maap_client.types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_ATTRS.keys())
+
+
 __all__ = [
     # Version
     "__version__",
@@ -1,14 +1,26 @@
 """OAuth2 authentication for MAAP API."""
 
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
+import functools
+import logging
+import re
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
 
-from maap_client.constants import DEFAULT_TOKEN_URL, DEFAULT_CREDENTIALS_FILE
+from maap_client.constants import DEFAULT_TOKEN_URL, DEFAULT_CREDENTIALS_FILE, DEFAULT_POOL_MAXSIZE
 from maap_client.exceptions import AuthenticationError, CredentialsError
 
+logger = logging.getLogger(__name__)
+
+# KEY=value lines; comment lines are skipped and values may contain "#" or "="
+_CREDENTIAL_LINE_RE = re.compile(r"^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)\s*$", re.MULTILINE)
+
 
 @dataclass
 class Credentials:
@@ -34,22 +46,24 @@ def load_credentials(credentials_file: Optional[Path] = None) -> Credentials:
     if not credentials_file.exists():
         raise CredentialsError(f"Credentials file not found: {credentials_file}")
 
-    creds = {}
-    with open(credentials_file, "r") as f:
-        for line in f:
+    text = credentials_file.read_text()
+    creds = dict(_CREDENTIAL_LINE_RE.findall(text))
+    if not creds:
+        # Fall back to the line-by-line parser for anything the regex misses
+        for line in text.splitlines():
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
-            if "=" not in line:
+            key, sep, value = line.partition("=")
+            if not sep:
                 continue
-            key, value = line.split("=", 1)
             creds[key.strip()] = value.strip()
 
     client_id = creds.get("CLIENT_ID")
     client_secret = creds.get("CLIENT_SECRET")
     offline_token = creds.get("OFFLINE_TOKEN")
 
-    if not all([client_id, client_secret, offline_token]):
+    if not (client_id and client_secret and offline_token):
         missing = []
         if not client_id:
             missing.append("CLIENT_ID")
@@ -74,6 +88,9 @@ class TokenManager:
         credentials: Credentials,
         token_url: str = DEFAULT_TOKEN_URL,
         token_lifetime_buffer: int = 60,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        stale_margin: int = 300,
+        executor: Optional[Executor] = None,
     ):
         """
         Initialize token manager.
@@ -82,24 +99,105 @@ class TokenManager:
             credentials: OAuth2 credentials
             token_url: Token endpoint URL
             token_lifetime_buffer: Seconds before expiry to refresh token
+            pool_maxsize: Connections kept per host by the authenticated session
+            stale_margin: Seconds before the refresh point at which a token is
+                stale: still returned, but renewed in the background
+            executor: Runs refreshes (default: a private single thread; see
+                shared_refresh_executor)
         """
         self._credentials = credentials
         self._token_url = token_url
         self._buffer = token_lifetime_buffer
         self._access_token: Optional[str] = None
-        self._expires_at: Optional[datetime] = None
+        # time.monotonic() deadline, already reduced by the refresh buffer
+        self._expires_at_monotonic = 0.0
+        self._stale_margin = stale_margin
+        self._stale_at_monotonic = 0.0
+
+        # At most one refresh in flight; callers join it instead of
+        # issuing their own
+        self._lock = threading.Lock()
+        self._refresh_future: Optional[Future] = None
+        self._executor = executor
+        self._own_executor: Optional[ThreadPoolExecutor] = None
+
+        # Keep the connection to the IAM endpoint alive across refreshes
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+        # Shared session for authenticated API calls (see authenticated_session)
+        self._pool_maxsize = pool_maxsize
+        self._auth_session: Optional[requests.Session] = None
 
     def get_token(self) -> str:
-        """Get a valid access token, refreshing if necessary."""
-        if self._is_token_valid():
-            return self._access_token
-        return self._refresh_token()
+        """
+        Get a valid access token, refreshing if necessary.
+
+        A fresh token is returned as is. A stale one (within stale_margin of
+        expiry) is still returned while a single background refresh renews
+        it, so long batches don't stall on the IAM round-trip. Only an
+        expired token blocks (see refresh).
+        """
+        token = self._access_token
+        now = time.monotonic()
+        if token is not None and now < self._expires_at_monotonic:
+            if now >= self._stale_at_monotonic:
+                self._start_background_refresh()
+            return token
+        return self.refresh()
+
+    def refresh(self) -> str:
+        """
+        Refresh the access token, joining a refresh already in flight.
+
+        Concurrent callers (e.g. download workers that all hit a 401 at
+        once) share one IAM round-trip, and a caller arriving after a
+        refresh completed gets the renewed token without issuing another.
+
+        Raises:
+            AuthenticationError: If the refresh this call started fails
+        """
+        with self._lock:
+            if self._is_token_valid():
+                return self._access_token
+            future = self._refresh_future
+            joined = future is not None and not future.done()
+            if not joined:
+                future = self._submit_refresh()
+        try:
+            return future.result()
+        except AuthenticationError:
+            if not joined:
+                raise
+        # The refresh we joined failed; make an attempt of our own
+        return self.refresh()
+
+    def _start_background_refresh(self) -> None:
+        """Submit a refresh unless one is already running or another thread renewed the token."""
+        with self._lock:
+            if self._refresh_future is not None and not self._refresh_future.done():
+                return
+            if time.monotonic() < self._stale_at_monotonic:
+                return
+            self._submit_refresh().add_done_callback(self._log_background_failure)
+
+    def _submit_refresh(self) -> Future:
+        """Start a refresh on the executor (caller holds self._lock)."""
+        if self._executor is None:
+            self._executor = self._own_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="maap-token"
+            )
+        self._refresh_future = self._executor.submit(self._refresh_token)
+        return self._refresh_future
+
+    @staticmethod
+    def _log_background_failure(future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug(f"Background token refresh failed: {future.exception()}")
 
     def _is_token_valid(self) -> bool:
         """Check if current token is still valid (with buffer)."""
-        if self._access_token is None or self._expires_at is None:
-            return False
-        return datetime.now(timezone.utc) < (self._expires_at - timedelta(seconds=self._buffer))
+        return self._access_token is not None and time.monotonic() < self._expires_at_monotonic
 
     def _refresh_token(self) -> str:
         """Exchange offline token for new access token."""
@@ -112,7 +210,7 @@ class TokenManager:
         }
 
         try:
-            response = requests.post(self._token_url, data=data, timeout=30)
+            response = self._session.post(self._token_url, data=data, timeout=30)
             response.raise_for_status()
         except requests.RequestException as e:
             raise AuthenticationError(f"Failed to refresh token: {e}")
@@ -124,15 +222,73 @@ class TokenManager:
         if not access_token:
             raise AuthenticationError("No access_token in IAM response")
 
+        lifetime = expires_in - self._buffer
+        now = time.monotonic()
         self._access_token = access_token
-        self._expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        self._expires_at_monotonic = now + lifetime
+        # Short-lived tokens go stale halfway, not immediately
+        self._stale_at_monotonic = now + max(lifetime - self._stale_margin, lifetime / 2)
 
         return self._access_token
 
-    def invalidate(self) -> None:
-        """Force token refresh on next get_token() call."""
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Force token refresh on next get_token() call.
+
+        Args:
+            token: The token a request was rejected with. If another thread
+                has already replaced it, nothing is dropped, so N workers
+                failing on the same token cause one refresh, not N.
+        """
+        if token is not None and token != self._access_token:
+            return
         self._access_token = None
-        self._expires_at = None
+        self._expires_at_monotonic = 0.0
+        self._stale_at_monotonic = 0.0
+
+    @property
+    def pool_maxsize(self) -> int:
+        """Connections kept per host by the shared authenticated session."""
+        return self._pool_maxsize
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared pooled session for authenticated requests (lazy initialization)."""
+        if self._auth_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=self._pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.auth = BearerAuth(self)
+            self._auth_session = session
+        return self._auth_session
+
+    def close(self) -> None:
+        """Close pooled connections (token endpoint and authenticated session)."""
+        if self._own_executor is not None:
+            self._own_executor.shutdown(wait=True)
+            self._executor = self._own_executor = None
+        self._session.close()
+        if self._auth_session is not None:
+            self._auth_session.close()
+            self._auth_session = None
+
+
+class BearerAuth(AuthBase):
+    """requests auth hook that injects the current bearer token at dispatch time."""
+
+    def __init__(self, token_manager: TokenManager):
+        self._token_manager = token_manager
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = f"Bearer {self._token_manager.get_token()}"
+        return r
+
+
+@functools.cache
+def shared_refresh_executor() -> ThreadPoolExecutor:
+    """Process-wide executor for token refreshes, so clients don't each start a thread."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="maap-token")
 
 
 def get_auth_headers(token_manager: TokenManager) -> dict:
@@ -142,7 +298,12 @@ def get_auth_headers(token_manager: TokenManager) -> dict:
 
 
 def authenticated_session(token_manager: TokenManager) -> requests.Session:
-    """Create a requests session with authentication headers."""
-    session = requests.Session()
-    session.headers.update(get_auth_headers(token_manager))
-    return session
+    """
+    Get the token manager's shared authenticated session.
+
+    The same session is returned on every call so connections are pooled
+    across API calls instead of paying a TLS handshake per new session.
+    The bearer token is injected per request by BearerAuth, so it never
+    goes stale after a refresh.
+    """
+    return token_manager.session
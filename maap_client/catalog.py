@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import types
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Union, get_args, get_origin, get_type_hints
+from typing import Any, Callable, Iterator, Union, get_args, get_origin, get_type_hints
 
 from maap_client.utils import parse_datetime, to_zulu
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional binary sidecar, see CatalogManager.MSGPACK_SIDECAR
+    msgpack = None
+
+
+# Sort key for (key, value) item pairs
+_get0 = itemgetter(0)
+
+
+# Values that to_dict() passes through unchanged
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# to_dict() converters keyed by exact type, for values that need no recursion
+_LEAF_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    **{t: _identity for t in _SCALAR_TYPES},
+    datetime: to_zulu,
+}
+
+
+def _is_complex_hint(hint: Any) -> bool:
+    """True if a type hint is, or contains, datetime or a Catalog subclass."""
+    if hint is datetime:
+        return True
+    if isinstance(hint, type) and issubclass(hint, Catalog):
+        return True
+    return any(_is_complex_hint(arg) for arg in get_args(hint))
+
 
 class Catalog:
     """
@@ -34,21 +74,47 @@ class Catalog:
     DEDUPE_STR_LISTS: bool = False
     SORT_NESTED_KEYS: list[str] = []  # Keys whose dict contents should be sorted
 
+    # Subclasses list their fields in __slots__ too; no per-instance __dict__
+    __slots__ = ("_extras",)
+
+    # Resolved __init__ type hints, filled per subclass (see __init_subclass__)
+    _hints_cached: dict[str, Any] | None = None
+    _LEAF: bool = False
+    _SLOT_NAMES: tuple[str, ...] = ()
+
     def __init__(self, **kwargs: Any):
         """
         Initialize catalog from keyword arguments.
 
         Args:
-            **kwargs: Field values stored as direct attributes.
+            **kwargs: Extra field values, kept in _extras (None when there
+                are none) and serialized ahead of the declared fields.
         """
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        self._extras: dict[str, Any] | None = kwargs or None
+
+    def _iter_fields(self) -> Iterator[tuple[str, Any]]:
+        """
+        Yield (name, value) for every attribute, public and private.
+
+        Subclasses keep their declared fields in __slots__ and anything
+        extra from **kwargs in _extras; extras come first, matching the
+        order they are set in __init__.
+        """
+        extras = self._extras
+        if extras:
+            yield from extras.items()
+        for name in self._SLOT_NAMES:
+            try:
+                yield name, getattr(self, name)
+            except AttributeError:  # slot never assigned
+                continue
 
     def to_dict(
         self,
         *,
         sort_keys: bool | None = None,
         dedupe_str_lists: bool | None = None,
+        shallow: bool = False,
     ) -> dict[str, Any]:
         """
         Convert catalog object to dictionary for JSON serialization.
@@ -66,6 +132,9 @@ class Catalog:
                 Defaults to class SORT_KEYS.
             dedupe_str_lists: Remove duplicates from string-only lists.
                 Defaults to class DEDUPE_STR_LISTS.
+            shallow: Leave nested Catalog objects, and containers that need
+                no sorting or dedupe, in place for a JSON encoder to finish
+                via json_default() instead of copying the whole tree.
 
         Returns:
             Dictionary suitable for JSON serialization.
@@ -73,27 +142,53 @@ class Catalog:
         sort_keys = self.SORT_KEYS if sort_keys is None else sort_keys
         dedupe_str_lists = self.DEDUPE_STR_LISTS if dedupe_str_lists is None else dedupe_str_lists
 
+        # Leaf fast path: a shallow copy is enough when every public value
+        # is a JSON scalar (anything else falls through to the full walk)
+        if self._LEAF and not sort_keys:
+            fast: dict[str, Any] = {}
+            for key, val in self._iter_fields():
+                if key.startswith("_"):
+                    continue
+                if type(val) not in _SCALAR_TYPES:
+                    break
+                fast[key] = val
+            else:
+                return fast
+
         sort_nested_keys = self.SORT_NESTED_KEYS
+        # Containers only need rebuilding when some policy can change them
+        walk_containers = not shallow or sort_keys or dedupe_str_lists or bool(sort_nested_keys)
 
         def convert_value(value: Any, key: str | None = None) -> Any:
             """Recursively convert any value type."""
 
+            # Exact built-in leaf types: one dict lookup instead of the
+            # isinstance chain below (which still handles subclasses)
+            leaf_converter = _LEAF_CONVERTERS.get(type(value))
+            if leaf_converter is not None:
+                return leaf_converter(value)
             # Catalog subclass
             if isinstance(value, Catalog):
+                if shallow:
+                    return value
                 return value.to_dict(sort_keys=sort_keys, dedupe_str_lists=dedupe_str_lists)
             # Datetime
             if isinstance(value, datetime):
                 return to_zulu(value)
             # Dict (recursive)
             if isinstance(value, dict):
+                if not walk_containers:
+                    return value
                 items = value.items()
                 # Sort if sort_keys is True OR if this key is in SORT_NESTED_KEYS
                 should_sort = sort_keys or (key is not None and key in sort_nested_keys)
                 if should_sort:
-                    items = sorted(items, key=lambda kv: kv[0])
+                    items = sorted(items, key=_get0)
                 return {k: convert_value(v, key=k) for k, v in items}
             # List (recursive, supports list-of-dicts, list-of-lists, etc.)
             if isinstance(value, list):
+                if not walk_containers:
+                    return value
                 converted_list = [convert_value(v, key=key) for v in value]
 
                 # Optional: dedupe only when *all* elements are strings (and list is non-empty)
@@ -111,9 +206,9 @@ class Catalog:
         # Serialize public attrs
         result: dict[str, Any] = {}
 
-        attrs_items = self.__dict__.items()
+        attrs_items = self._iter_fields()
         if sort_keys:
-            attrs_items = sorted(attrs_items, key=lambda kv: kv[0])
+            attrs_items = sorted(attrs_items, key=_get0)
 
         for key, val in attrs_items:
             if key.startswith("_"):
@@ -122,6 +217,121 @@ class Catalog:
 
         return result
 
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # Resolve __init__ hints once at class definition so the first
+        # from_dict() doesn't pay for it. A forward reference to a class
+        # defined later in the module can't resolve yet; _hints() retries.
+        try:
+            cls._hints_cached = get_type_hints(cls.__init__)
+        except NameError:
+            cls._hints_cached = None
+        # Declared __slots__ across the MRO (base first), see _iter_fields()
+        slot_names: list[str] = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            slot_names.extend((slots,) if isinstance(slots, str) else slots)
+        slot_names = [
+            name for name in slot_names if name not in ("_extras", "__dict__", "__weakref__")
+        ]
+        cls._SLOT_NAMES = tuple(slot_names)
+        # Leaf classes declare no datetime/Catalog fields (even nested in
+        # containers), so to_dict() can usually skip convert_value().
+        cls._LEAF = cls._hints_cached is not None and not any(
+            _is_complex_hint(hint)
+            for name, hint in cls._hints_cached.items()
+            if name not in ("return", "kwargs")
+        )
+
+    @classmethod
+    def _hints(cls) -> dict[str, Any]:
+        """Resolved __init__ type hints, computed once per class."""
+        hints = cls.__dict__.get("_hints_cached")
+        if hints is None:
+            hints = get_type_hints(cls.__init__)
+            cls._hints_cached = hints
+        return hints
+
+    @classmethod
+    @functools.cache
+    def _field_converters(cls) -> dict[str, Callable[[Any], Any]]:
+        """Per-field value converters built once from the __init__ type hints."""
+        return {
+            name: cls._make_converter(hint)
+            for name, hint in cls._hints().items()
+            if name not in ("return", "kwargs")
+        }
+
+    @classmethod
+    def _make_converter(cls, hint: Any) -> Callable[[Any], Any]:
+        """
+        Specialize a converter for one type hint.
+
+        Dispatch on the hint happens here, once per field, so from_dict only
+        pays a function call per value instead of get_origin/get_args checks.
+        """
+        # Handle Optional[T] and T | None (Python 3.10+)
+        origin = get_origin(hint)
+        if origin is Union or origin is getattr(types, "UnionType", None):
+            args = [arg for arg in get_args(hint) if arg is not type(None)]
+            if len(args) == 1:
+                hint = args[0]
+                origin = get_origin(hint)
+
+        # Datetime
+        if hint == datetime:
+            def convert(value: Any) -> Any:
+                return parse_datetime(value) if isinstance(value, str) else value
+            return convert
+
+        # Catalog subclass
+        if isinstance(hint, type) and issubclass(hint, Catalog):
+            nested_from_dict = hint.from_dict
+
+            def convert(value: Any) -> Any:
+                return nested_from_dict(value) if isinstance(value, dict) else value
+            return convert
+
+        args = get_args(hint)
+
+        # dict[str, T] - recursively convert values
+        if origin == dict and len(args) == 2:
+            convert_item = cls._make_converter(args[1])
+            sort_keys = cls.SORT_KEYS
+
+            def convert(value: Any) -> Any:
+                if not isinstance(value, dict):
+                    return value
+                items = sorted(value.items(), key=_get0) if sort_keys else value.items()
+                return {
+                    k: None if v is None else convert_item(v) for k, v in items
+                }
+            return convert
+
+        # list[T] - recursively convert elements
+        if origin == list and args:
+            convert_item = cls._make_converter(args[0])
+            dedupe_str_lists = cls.DEDUPE_STR_LISTS
+
+            def convert(value: Any) -> Any:
+                if not isinstance(value, list):
+                    return value
+                converted_list = [
+                    None if item is None else convert_item(item) for item in value
+                ]
+                # Optional: dedupe only when all elements are strings
+                if (
+                    dedupe_str_lists
+                    and converted_list
+                    and all(isinstance(v, str) for v in converted_list)
+                ):
+                    return list(dict.fromkeys(converted_list))
+                return converted_list
+            return convert
+
+        # Everything else
+        return _identity
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Catalog:
         """
@@ -140,78 +350,45 @@ class Catalog:
         Returns:
             New instance of the catalog class.
         """
-        try:
-            hints = get_type_hints(cls.__init__)
-        except Exception:
-            return cls(**data)
-
-        # hints to determine target type
-        def strip_optional(hint: Any) -> Any:
-            """Handle Optional[T] and T | None (Python 3.10+)."""
-            origin = get_origin(hint)
-            if origin is Union or origin is getattr(types, "UnionType", None):
-                args = [arg for arg in get_args(hint) if arg is not type(None)]
-                return args[0] if len(args) == 1 else hint
-            return hint
-
-        def convert_value(value: Any, hint: Any) -> Any:
-            """Recursively convert a value based on its type hint."""
-            if value is None:
-                return None
-
-            hint = strip_optional(hint)
-            origin = get_origin(hint)
-
-            # Datetime
-            if hint == datetime and isinstance(value, str):
-                return parse_datetime(value)
-            # Catalog subclass
-            if isinstance(hint, type) and issubclass(hint, Catalog) and isinstance(value, dict):
-                return hint.from_dict(value)
-            # dict[str, T] - recursively convert values
-            if origin == dict and isinstance(value, dict):
-                args = get_args(hint)
-                if len(args) == 2:
-                    value_hint = args[1]
-                    items = sorted(value.items()) if cls.SORT_KEYS else value.items()
-                    return {k: convert_value(v, value_hint) for k, v in items}
-                return value
-            # list[T] - recursively convert elements
-            if origin == list and isinstance(value, list):
-                args = get_args(hint)
-                if args:
-                    elem_hint = args[0]
-                    converted_list = [convert_value(item, elem_hint) for item in value]
-
-                    # Optional: dedupe only when all elements are strings
-                    if (
-                        cls.DEDUPE_STR_LISTS
-                        and converted_list
-                        and all(isinstance(v, str) for v in converted_list)
-                    ):
-                        return list(dict.fromkeys(converted_list))
-
-                    return converted_list
-                return value
-            # Everything else
-            return value
-
+        converters = cls._field_converters()
         converted: dict[str, Any] = {}
         for key, value in data.items():
-            if key in hints:
-                converted[key] = convert_value(value, hints[key])
-            else:
-                converted[key] = value
+            converter = converters.get(key)
+            converted[key] = value if converter is None else converter(value)
 
         return cls(**converted)
 
     def __repr__(self) -> str:
         attrs = ", ".join(
-            f"{k}={v!r}" for k, v in self.__dict__.items() if not k.startswith("_")
+            f"{k}={v!r}" for k, v in self._iter_fields() if not k.startswith("_")
         )
         return f"{self.__class__.__name__}({attrs})"
 
 
+def json_default(
+    sort_keys: bool = False,
+    dedupe_str_lists: bool = False,
+) -> Callable[[Any], Any]:
+    """
+    Build a JSON encoder ``default`` hook that serializes Catalog objects.
+
+    Nested catalogs are expanded one level at a time with to_dict(shallow=True)
+    while the encoder walks the tree, so no full intermediate copy is built.
+    The root's sort/dedupe policy is applied throughout, as with to_dict().
+    """
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, Catalog):
+            return obj.to_dict(
+                sort_keys=sort_keys, dedupe_str_lists=dedupe_str_lists, shallow=True
+            )
+        if isinstance(obj, datetime):
+            return to_zulu(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    return default
+
+
 class CatalogManager:
     """
     Base class for catalog managers with file persistence and caching.
@@ -222,17 +399,29 @@ class CatalogManager:
 
     Subclasses must override:
         FILENAME_PATTERN: Format string with {collection} placeholder.
-        DEFAULT_DIR: Default directory for catalog files.
+        default_dir(): Default directory for catalog files.
         CATALOG_CLASS: The Catalog subclass to instantiate when loading.
+
+    Class Attributes:
+        MSGPACK_SIDECAR: If True and msgpack is installed, save() also writes
+            a .msgpack copy next to the JSON file and load() prefers it while
+            it is at least as new as the JSON. The JSON stays canonical.
+            Default: False.
     """
 
     # Subclasses must override these
     FILENAME_PATTERN: str = "{collection}.json"
-    DEFAULT_DIR: Path = Path(".")
     CATALOG_CLASS: type[Catalog]
 
+    MSGPACK_SIDECAR: bool = False
+
+    @classmethod
+    def default_dir(cls) -> Path:
+        """Default directory for catalog files."""
+        return Path(".")
+
     def __init__(self, catalog_dir: Path | None = None):
-        self._catalog_dir = catalog_dir or self.DEFAULT_DIR
+        self._catalog_dir = catalog_dir or self.default_dir()
         self._cache: dict[str, Catalog] = {}
 
     def get_path(self, collection: str) -> Path:
@@ -248,19 +437,85 @@ class CatalogManager:
         if not path.exists():
             return None
 
-        with open(path, "r") as f:
-            catalog = self.CATALOG_CLASS.from_dict(json.load(f))
+        data = self._load_sidecar(path)
+        if data is None:
+            if orjson is not None:
+                data = orjson.loads(path.read_bytes())
+            else:
+                with open(path, "r") as f:
+                    data = json.load(f)
+        catalog = self.CATALOG_CLASS.from_dict(data)
 
         self._cache[collection] = catalog
         return catalog
 
-    def save(self, catalog: Catalog) -> Path:
-        """Save catalog to disk atomically and update cache."""
+    def save(self, catalog: Catalog, sidecar: bool = True) -> Path:
+        """
+        Save catalog to disk atomically and update cache.
+
+        Args:
+            catalog: Catalog to write
+            sidecar: Also refresh the msgpack sidecar (see MSGPACK_SIDECAR).
+                Intermediate checkpoints pass False; the stale sidecar is
+                then older than the JSON, so load() ignores it.
+        """
         path = self.get_path(catalog.collection)
         path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = path.with_suffix(path.suffix + ".tmp")
-        with open(tmp_path, "w") as f:
-            json.dump(catalog.to_dict(), f, indent=2)
+        # A fully sorted catalog is sorted by the encoder in C instead of
+        # by to_dict in Python; SORT_NESTED_KEYS still apply either way.
+        sort_keys = catalog.SORT_KEYS
+        default = json_default(sort_keys=False, dedupe_str_lists=catalog.DEDUPE_STR_LISTS)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            tmp_path.write_bytes(orjson.dumps(catalog, default=default, option=option))
+        else:
+            with open(tmp_path, "w") as f:
+                json.dump(catalog, f, indent=2, sort_keys=sort_keys, default=default)
         os.replace(tmp_path, path)
+        if sidecar:
+            self._save_sidecar(path, catalog)
         self._cache[catalog.collection] = catalog
         return path
+
+    def save_raw(self, catalog: Catalog, raw: bytes) -> Path:
+        """
+        Save already-serialized JSON bytes for a catalog atomically and update cache.
+
+        For payloads that need no normalization, so the source bytes can be
+        written as-is instead of re-serializing the catalog.
+        """
+        path = self.get_path(catalog.collection)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, path)
+        self._save_sidecar(path, catalog)
+        self._cache[catalog.collection] = catalog
+        return path
+
+    def _sidecar_path(self, path: Path) -> Path:
+        return path.with_suffix(".msgpack")
+
+    def _load_sidecar(self, path: Path) -> dict[str, Any] | None:
+        """Read the msgpack sidecar if enabled and not older than the JSON."""
+        if not self.MSGPACK_SIDECAR or msgpack is None:
+            return None
+        sidecar = self._sidecar_path(path)
+        try:
+            if sidecar.stat().st_mtime < path.stat().st_mtime:
+                return None
+            return msgpack.unpackb(sidecar.read_bytes(), raw=False)
+        except (OSError, ValueError, msgpack.ExtraData, msgpack.FormatError, msgpack.StackError):
+            return None
+
+    def _save_sidecar(self, path: Path, catalog: Catalog) -> None:
+        """Write the msgpack sidecar after the JSON (so it is never older)."""
+        if not self.MSGPACK_SIDECAR or msgpack is None:
+            return
+        sidecar = self._sidecar_path(path)
+        tmp_path = sidecar.with_suffix(sidecar.suffix + ".tmp")
+        tmp_path.write_bytes(msgpack.packb(catalog.to_dict(), use_bin_type=True))
+        os.replace(tmp_path, sidecar)
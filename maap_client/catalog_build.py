@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional, cast
+import bisect
+import functools
 import logging
+import threading
 
 from maap_client.catalog import Catalog, CatalogManager
-from maap_client.constants import __version__, DEFAULT_BUILT_CATALOG_DIR
+from maap_client.constants import __version__, DEFAULT_BUILT_CATALOG_DIR, DEFAULT_BUILD_WORKERS
 from maap_client.utils import parse_datetime, to_zulu
 
 
@@ -24,6 +28,8 @@ class ProductInfo(Catalog):
     DEDUPE_STR_LISTS = True
     SORT_NESTED_KEYS = ["baselines"]  # Sort baselines dict
 
+    __slots__ = ("baselines", "_sorted_names")
+
     def __init__(
         self,
         baselines: Optional[dict[str, "BaselineInfo"]] = None,
@@ -31,6 +37,8 @@ class ProductInfo(Catalog):
     ) -> None:
         super().__init__(**kwargs)
         self.baselines = {} if baselines is None else baselines
+        # Baseline names kept in sorted order by set_baseline()
+        self._sorted_names: list[str] = sorted(self.baselines)
 
     def get_baseline(self, name: str) -> Optional["BaselineInfo"]:
         """Return baseline info by name."""
@@ -38,27 +46,43 @@ class ProductInfo(Catalog):
 
     def set_baseline(self, name: str, info: "BaselineInfo") -> None:
         """Set/update baseline info."""
+        if name not in self.baselines:
+            bisect.insort(self._sorted_names, name)
         self.baselines[name] = info
 
     def list_baselines(self) -> list[str]:
         """List baseline names (sorted)."""
-        return sorted(self.baselines.keys())
+        if len(self._sorted_names) != len(self.baselines):
+            # baselines was modified directly; resync
+            self._sorted_names = sorted(self.baselines)
+        return self._sorted_names[:]
     
 
 class BaselineInfo(Catalog):
-    """Baseline info summary."""
+    """
+    Baseline info summary.
+
+    Times are kept as ISO 8601 strings as loaded (datetimes are accepted
+    too); use time_start_dt/time_end_dt or time_range() for parsed values,
+    so loading a large catalog doesn't parse every timestamp up front.
+    """
 
     SORT_KEYS = False
     DEDUPE_STR_LISTS = True
 
+    __slots__ = (
+        "time_start", "time_end", "frame_start", "frame_end", "count", "updated_at",
+        "_time_start_parsed", "_time_end_parsed",
+    )
+
     def __init__(
         self,
-        time_start: Optional[datetime] = None,
-        time_end: Optional[datetime] = None,
+        time_start: Optional[str] = None,
+        time_end: Optional[str] = None,
         frame_start: Optional[str] = None,
         frame_end: Optional[str] = None,
         count: int = 0,
-        updated_at: Optional[datetime] = None,
+        updated_at: Optional[str] = None,
         # periods: Optional[list[Any]] = None,
         **kwargs: Any,
     ) -> None:
@@ -72,21 +96,59 @@ class BaselineInfo(Catalog):
         self.updated_at = updated_at
         # self.periods = [] if periods is None else periods
 
+    def _parsed(self, value: Any, cache_slot: str) -> Optional[datetime]:
+        """Parse a time string once, caching it against the raw value."""
+        if not isinstance(value, str):
+            return value
+        cached = getattr(self, cache_slot, None)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        parsed = parse_datetime(value)
+        setattr(self, cache_slot, (value, parsed))
+        return parsed
+
+    @property
+    def time_start_dt(self) -> Optional[datetime]:
+        """time_start as a datetime (parsed on first access)."""
+        return self._parsed(self.time_start, "_time_start_parsed")
+
+    @property
+    def time_end_dt(self) -> Optional[datetime]:
+        """time_end as a datetime (parsed on first access)."""
+        return self._parsed(self.time_end, "_time_end_parsed")
+
     def time_range(self) -> Optional[tuple[datetime, datetime]]:
         if self.time_start is None or self.time_end is None:
             return None
-
-        start = parse_datetime(self.time_start) if isinstance(self.time_start, str) else self.time_start
-        end = parse_datetime(self.time_end) if isinstance(self.time_end, str) else self.time_end
-        return (start, end)
+        return (self.time_start_dt, self.time_end_dt)
 
     def to_dict(
         self,
         sort_keys: bool | None = None,
         dedupe_str_lists: bool | None = None,
+        shallow: bool = False,
     ) -> dict[str, Any]:
         """Convert to dict, excluding null frame values."""
-        d = super().to_dict(sort_keys=sort_keys, dedupe_str_lists=dedupe_str_lists)
+        # Fast path for the common case of only the declared fields (no
+        # **kwargs extras): build the dict directly instead of the generic
+        # recursive walk.
+        if not (self.SORT_KEYS if sort_keys is None else sort_keys) and self._extras is None:
+            time_start, time_end, updated_at = self.time_start, self.time_end, self.updated_at
+            d: dict[str, Any] = {
+                "time_start": to_zulu(time_start) if isinstance(time_start, datetime) else time_start,
+                "time_end": to_zulu(time_end) if isinstance(time_end, datetime) else time_end,
+            }
+            if self.frame_start is not None:
+                d["frame_start"] = self.frame_start
+            if self.frame_end is not None:
+                d["frame_end"] = self.frame_end
+            d["count"] = self.count
+            d["updated_at"] = to_zulu(updated_at) if isinstance(updated_at, datetime) else updated_at
+            return d
+
+        d = super().to_dict(
+            sort_keys=sort_keys, dedupe_str_lists=dedupe_str_lists, shallow=shallow
+        )
         # Remove null frame values (Aeolus doesn't have orbit frames)
         if d.get("frame_start") is None:
             del d["frame_start"]
@@ -101,6 +163,9 @@ class CatalogCollection(Catalog):
     SORT_KEYS = False  # Preserve insertion order for top-level keys
     SORT_NESTED_KEYS = ["products", "baselines"]  # Sort these nested dicts
 
+    # In serialization order (the order __init__ used to assign them)
+    __slots__ = ("schema", "generated_at", "collection", "client", "products")
+
     def __init__(
         self,
         collection: str = "",
@@ -136,8 +201,14 @@ class CatalogCollectionManager(CatalogManager):
     """Manages catalog collection building, saving, and loading."""
 
     FILENAME_PATTERN = "{collection}_collection.json"
-    DEFAULT_DIR = Path(DEFAULT_BUILT_CATALOG_DIR).expanduser()
     CATALOG_CLASS = CatalogCollection
+    MSGPACK_SIDECAR = True  # Large, loaded on every from_built lookup
+
+    @classmethod
+    @functools.cache
+    def default_dir(cls) -> Path:
+        """Default built-catalog directory (expanded once, on first use)."""
+        return Path(DEFAULT_BUILT_CATALOG_DIR).expanduser()
 
     def __init__(
         self,
@@ -154,6 +225,8 @@ class CatalogCollectionManager(CatalogManager):
         super().__init__(catalog_dir)
         self._client = client
         self.last_failures: list[tuple[str, str, str]] = []
+        # Serializes catalog mutation + checkpoint saves across build workers
+        self._lock = threading.Lock()
 
     def build(
         self,
@@ -163,6 +236,7 @@ class CatalogCollectionManager(CatalogManager):
         latest_baseline: bool = False,
         force: bool = False,
         verbose: bool = False,
+        max_workers: int = DEFAULT_BUILD_WORKERS,
     ) -> CatalogCollection:
         """
         Build or update a catalog for a collection.
@@ -174,6 +248,7 @@ class CatalogCollectionManager(CatalogManager):
             latest_baseline: If True, only update the latest baseline per product
             force: If True, delete existing catalog and rebuild from scratch
             verbose: Print progress messages
+            max_workers: Number of products processed concurrently
 
         Returns:
             The built/updated CatalogCollection
@@ -237,176 +312,204 @@ class CatalogCollectionManager(CatalogManager):
         if products_filter:
             products = [p for p in products if p in products_filter]
 
+        # Create product entries up front so concurrent workers only ever
+        # touch their own ProductInfo.
+        product_infos = []
         for product in products:
-            if verbose:
-                logger.info(f"Processing {product}...")
-
-            # Get all baselines from queryables (without verification - we'll verify during metadata fetch)
-            all_baselines = self._client.list_baselines(collection, product, from_built=False, verify=False)
-
-            # Get or create product entry
             product_info = catalog.get_product(product)
             if product_info is None:
                 product_info = ProductInfo()
                 catalog.set_product(product, product_info)
+            product_infos.append((product, product_info))
+
+        # Warm lazy client attributes before fanning out to threads
+        _ = self._client.searcher.client
+
+        # Products are independent and I/O bound: overlap their STAC requests
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._build_product, catalog, collection, product, product_info,
+                    baselines_filter, latest_baseline, now, verbose,
+                )
+                for product, product_info in product_infos
+            ]
+            for future in futures:
+                future.result()
 
-            # Determine which baselines to update
-            if baselines_filter:
-                # Use specified baselines only (case-insensitive comparison)
-                filter_upper = [f.upper() for f in baselines_filter]
-                baselines_to_update = [b for b in all_baselines if b.upper() in filter_upper]
-           
-            # Note that new baselines added to queryables won't be picked up with
-            # --latest-baseline until a full rebuild 
-            # "update the latest baseline I already know about"
-            elif latest_baseline:
-                existing_baselines = product_info.list_baselines()
-                if existing_baselines:
-                    # Use existing catalog baselines, pick alphabetically latest
-                    baselines_to_update = [existing_baselines[-1]]
-                else:
-                    # No existing catalog - get verified baselines and pick the last one (alphabetically latest)
-                    verified_baselines = self._client.list_baselines(collection, product, from_built=False, verify=True)
-                    if verified_baselines:
-                        # Already sorted
-                        # baselines_to_update = [sorted(verified_baselines)[-1]]
-                        baselines_to_update = [verified_baselines[-1]]
-                    else:
-                        baselines_to_update = []
+        return catalog
+
+    def _build_product(
+        self,
+        catalog: CatalogCollection,
+        collection: str,
+        product: str,
+        product_info: ProductInfo,
+        baselines_filter: Optional[list[str]],
+        latest_baseline: bool,
+        now: str,
+        verbose: bool,
+    ) -> None:
+        """Update one product's baselines in ``catalog`` (runs on a build worker)."""
+        if verbose:
+            logger.info(f"Processing {product}...")
+
+        # Get all baselines from queryables (without verification - we'll verify during metadata fetch)
+        all_baselines = self._client.list_baselines(collection, product, from_built=False, verify=False)
+
+        # Determine which baselines to update
+        if baselines_filter:
+            # Use specified baselines only (case-insensitive comparison)
+            filter_upper = [f.upper() for f in baselines_filter]
+            baselines_to_update = [b for b in all_baselines if b.upper() in filter_upper]
+
+        # Note that new baselines added to queryables won't be picked up with
+        # --latest-baseline until a full rebuild 
+        # "update the latest baseline I already know about"
+        elif latest_baseline:
+            existing_baselines = product_info.list_baselines()
+            if existing_baselines:
+                # Use existing catalog baselines, pick alphabetically latest
+                baselines_to_update = [existing_baselines[-1]]
             else:
-                baselines_to_update = all_baselines
+                # No existing catalog - get verified baselines and pick the last one (alphabetically latest)
+                verified_baselines = self._client.list_baselines(collection, product, from_built=False, verify=True)
+                if verified_baselines:
+                    # Already sorted
+                    # baselines_to_update = [sorted(verified_baselines)[-1]]
+                    baselines_to_update = [verified_baselines[-1]]
+                else:
+                    baselines_to_update = []
+        else:
+            baselines_to_update = all_baselines
 
-            # Iterate on baselines to update
-            for baseline in baselines_to_update:
-                if verbose:
-                    logger.info(f"  Checking {baseline}...")
-
-                try:
-                    existing = product_info.get_baseline(baseline)
-                    ex_range = existing.time_range() if existing else None
-
-                    # Authoritative recount first for known baselines: the
-                    # server's total matched for productType+productVersion,
-                    # no time filter. Additions anywhere raise the total, so
-                    # an unchanged one means no new data and the gap fetches
-                    # below are skipped (edges moving while the count stays
-                    # equal would need server-side deletions, which already
-                    # require --force). search_product_count maps a missing
-                    # numberMatched to 0, so recount is always an int.
-                    recount = 0
-                    if existing is not None:
-                        recount = self._client.searcher.search_product_count(
-                            collection, product, baseline
-                        )
-                        if recount == 0:
-                            # A transiently-empty matched must never wipe the
-                            # catalog.
-                            logger.warning(
-                                f"    RECOUNT returned 0 for {product}/{baseline} "
-                                f"with existing data; keeping catalog entry"
-                            )
-                            self.last_failures.append(
-                                (product, baseline, "recount returned 0 with existing data")
-                            )
-                            continue
-                        if recount == existing.count:
-                            if verbose:
-                                logger.info("    SKIP (no change)")
-                            continue
-
-                    # Use mission boundaries (full mission range)
-                    effective_start, effective_end = self._client.normalize_time_range(None, None)
-
-                    # Build list of (start, end, updates_start) ranges to fetch
-                    # updates_start: True=before, False=after, None=full (update both)
-                    to_fetch: list[tuple[datetime, datetime, Optional[bool]]] = []
-                    if ex_range:
-                        t0, t1 = ex_range
-                        if effective_start < t0:
-                            to_fetch.append((effective_start, t0 - timedelta(seconds=1), True))
-                        if effective_end > t1:
-                            to_fetch.append((t1 + timedelta(seconds=1), effective_end, False))
-                    else:
-                        to_fetch.append((effective_start, effective_end, None))  # Full fetch
-
-                    # Fetch ranges and merge results
-                    new_count = 0
-                    result = dict(
-                        time_start=existing.time_start if existing else None,
-                        time_end=existing.time_end if existing else None,
-                        frame_start=existing.frame_start if existing else None,
-                        frame_end=existing.frame_end if existing else None,
+        # Iterate on baselines to update
+        for baseline in baselines_to_update:
+            if verbose:
+                logger.info(f"  Checking {baseline}...")
+
+            try:
+                existing = product_info.get_baseline(baseline)
+                ex_range = existing.time_range() if existing else None
+
+                # Authoritative recount first for known baselines: the
+                # server's total matched for productType+productVersion,
+                # no time filter. Additions anywhere raise the total, so
+                # an unchanged one means no new data and the gap fetches
+                # below are skipped (edges moving while the count stays
+                # equal would need server-side deletions, which already
+                # require --force). search_product_count maps a missing
+                # numberMatched to 0, so recount is always an int.
+                recount = 0
+                if existing is not None:
+                    recount = self._client.searcher.search_product_count(
+                        collection, product, baseline
                     )
-                    for f_start, f_end, updates_start in to_fetch:
-                        # Log the time range being fetched
-                        if verbose:
-                            logger.info(f"    Fetching : {to_zulu(f_start)} - {to_zulu(f_end)}")
-
-                        if not self._client.searcher.search_has_any_product(
-                            collection, product, baseline, f_start, f_end
-                        ):
-                            continue
-                        info = self._client.get_baseline_info(
-                            collection, product, baseline, f_start, f_end, from_built=False
+                    if recount == 0:
+                        # A transiently-empty matched must never wipe the
+                        # catalog.
+                        logger.warning(
+                            f"    RECOUNT returned 0 for {product}/{baseline} "
+                            f"with existing data; keeping catalog entry"
                         )
-                        if info:
-                            new_count += info.count
-                            if updates_start is None or updates_start:  # full or before
-                                result["time_start"] = info.time_start
-                                result["frame_start"] = info.frame_start
-                            if updates_start is None or not updates_start:  # full or after
-                                result["time_end"] = info.time_end
-                                result["frame_end"] = info.frame_end
-
-                    # New baseline: recount only if its windows saw data
-                    # (saves a request for the empty product x baseline
-                    # combinations from queryables).
-                    if existing is None and new_count > 0:
-                        recount = self._client.searcher.search_product_count(
-                            collection, product, baseline
+                        self.last_failures.append(
+                            (product, baseline, "recount returned 0 with existing data")
                         )
-                except Exception as e:
-                    # Transport retries are exhausted by now: record and move on
-                    # so one bad baseline doesn't discard the rest of the pass.
-                    logger.warning(f"    FAILED ({product}/{baseline}): {e}")
-                    self.last_failures.append((product, baseline, str(e)))
-                    continue
-
-                count = recount if recount > 0 else new_count
-                if count == 0:
+                        continue
+                    if recount == existing.count:
+                        if verbose:
+                            logger.info("    SKIP (no change)")
+                        continue
+
+                # Use mission boundaries (full mission range)
+                effective_start, effective_end = self._client.normalize_time_range(None, None)
+
+                # Build list of (start, end, updates_start) ranges to fetch
+                # updates_start: True=before, False=after, None=full (update both)
+                to_fetch: list[tuple[datetime, datetime, Optional[bool]]] = []
+                if ex_range:
+                    t0, t1 = ex_range
+                    if effective_start < t0:
+                        to_fetch.append((effective_start, t0 - timedelta(seconds=1), True))
+                    if effective_end > t1:
+                        to_fetch.append((t1 + timedelta(seconds=1), effective_end, False))
+                else:
+                    to_fetch.append((effective_start, effective_end, None))  # Full fetch
+
+                # Fetch ranges and merge results
+                new_count = 0
+                result = dict(
+                    time_start=existing.time_start if existing else None,
+                    time_end=existing.time_end if existing else None,
+                    frame_start=existing.frame_start if existing else None,
+                    frame_end=existing.frame_end if existing else None,
+                )
+                for f_start, f_end, updates_start in to_fetch:
+                    # Log the time range being fetched
                     if verbose:
-                        logger.info("    SKIP (no data)")
-                    continue
-                if recount == 0:
-                    # New baseline whose windows saw data but the recount says
-                    # 0: keep the window sum this pass.
-                    logger.warning(
-                        f"    RECOUNT returned 0 for {product}/{baseline}; "
-                        f"using window count {new_count}"
-                    )
+                        logger.info(f"    Fetching : {to_zulu(f_start)} - {to_zulu(f_end)}")
 
-                # Reaching here implies a change: a known baseline only gets
-                # past the recount gate when the server total differs, and a
-                # new baseline with data is always new.
+                    _, info = self._client.try_get_baseline_info(
+                        collection, product, baseline, f_start, f_end
+                    )
+                    if info:
+                        new_count += info.count
+                        if updates_start is None or updates_start:  # full or before
+                            result["time_start"] = info.time_start
+                            result["frame_start"] = info.frame_start
+                        if updates_start is None or not updates_start:  # full or after
+                            result["time_end"] = info.time_end
+                            result["frame_end"] = info.frame_end
+
+                # New baseline: recount only if its windows saw data
+                # (saves a request for the empty product x baseline
+                # combinations from queryables).
+                if existing is None and new_count > 0:
+                    recount = self._client.searcher.search_product_count(
+                        collection, product, baseline
+                    )
+            except Exception as e:
+                # Transport retries are exhausted by now: record and move on
+                # so one bad baseline doesn't discard the rest of the pass.
+                logger.warning(f"    FAILED ({product}/{baseline}): {e}")
+                self.last_failures.append((product, baseline, str(e)))
+                continue
+
+            count = recount if recount > 0 else new_count
+            if count == 0:
+                if verbose:
+                    logger.info("    SKIP (no data)")
+                continue
+            if recount == 0:
+                # New baseline whose windows saw data but the recount says
+                # 0: keep the window sum this pass.
+                logger.warning(
+                    f"    RECOUNT returned 0 for {product}/{baseline}; "
+                    f"using window count {new_count}"
+                )
+
+            # Reaching here implies a change: a known baseline only gets
+            # past the recount gate when the server total differs, and a
+            # new baseline with data is always new.
+            with self._lock:
                 product_info.set_baseline(baseline, BaselineInfo(
                     **result, count=count, updated_at=now,
                 ))
                 # Checkpoint: persist progress so a later failure never
-                # discards baselines already fetched in this run.
-                self.save(catalog)
-                if verbose:
-                    if existing is None:
-                        logger.info(f"    OK (count={count})")
-                    elif new_count > 0:
-                        logger.info(f"    OK (added {new_count}, count={count})")
-                    else:
-                        reason = (
-                            "in-range backfill"
-                            if count > existing.count
-                            else "in-range deletions; use --force if edges became stale"
-                        )
-                        logger.info(
-                            f"    count adjusted {existing.count} -> {count} ({reason})"
-                        )
-
-        return catalog
+                # discards baselines already fetched in this run. The
+                # msgpack sidecar is left to the final save.
+                self.save(catalog, sidecar=False)
+            if verbose:
+                if existing is None:
+                    logger.info(f"    OK (count={count})")
+                elif new_count > 0:
+                    logger.info(f"    OK (added {new_count}, count={count})")
+                else:
+                    reason = (
+                        "in-range backfill"
+                        if count > existing.count
+                        else "in-range deletions; use --force if edges became stale"
+                    )
+                    logger.info(
+                        f"    count adjusted {existing.count} -> {count} ({reason})"
+                    )
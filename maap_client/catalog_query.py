@@ -2,25 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import requests
 
 from maap_client.catalog import Catalog, CatalogManager
-from maap_client.constants import DEFAULT_CATALOG_URL, DEFAULT_COLLECTIONS, DEFAULT_CATALOG_DIR, DEFAULT_TIMEOUT
+from maap_client.constants import (
+    DEFAULT_CATALOG_URL,
+    DEFAULT_COLLECTIONS,
+    DEFAULT_CATALOG_DIR,
+    DEFAULT_QUERYABLES_WORKERS,
+    DEFAULT_TIMEOUT,
+)
 from maap_client.exceptions import CatalogError
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to Response.json()
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (required by httpx for http2=True)
+    import httpx
+except ImportError:  # optional, falls back to the threaded requests session
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
 
+def _loop_running() -> bool:
+    """True when called from inside a running asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _has_duplicate_strs(value: Any) -> bool:
+    """True if any string-only list in a JSON tree has duplicates (see DEDUPE_STR_LISTS)."""
+    if isinstance(value, dict):
+        return any(map(_has_duplicate_strs, value.values()))
+    if isinstance(value, list):
+        if value and all(isinstance(v, str) for v in value):
+            return len(set(value)) != len(value)
+        return any(map(_has_duplicate_strs, value))
+    return False
+
+
 class CatalogQueryables(Catalog):
     """Queryables catalog with collection and properties."""
 
     SORT_KEYS = False
     DEDUPE_STR_LISTS = True
 
+    __slots__ = (
+        "collection", "properties", "_prop_keys", "_products_cache", "_baselines_cache",
+    )
+
     def __init__(
         self,
         collection: str = "",
@@ -30,30 +76,47 @@ class CatalogQueryables(Catalog):
         super().__init__(**kwargs)
         self.collection = collection
         self.properties = properties or {}
+        # Derived data, computed once (queryables don't change once loaded)
+        self._prop_keys = frozenset(self.properties)
+        self._products_cache: Optional[list[str]] = None
+        self._baselines_cache: Optional[list[str]] = None
+
+    def _enum(self, name: str) -> list[str]:
+        """Enum values of a queryable property (or the property itself if a list)."""
+        if name not in self._prop_keys:
+            return []
+        prop = self.properties[name]
+        return prop.get("enum", []) if isinstance(prop, dict) else prop
 
     def list_products(self) -> list[str]:
         """List product types from queryables."""
-        prop = self.properties.get("product:type", {})
-        return prop.get("enum", []) if isinstance(prop, dict) else prop
+        if self._products_cache is None:
+            self._products_cache = list(self._enum("product:type"))
+        return self._products_cache[:]
 
     def list_baselines(self) -> list[str]:
         """List baseline versions from queryables (uppercase)."""
-        prop = self.properties.get("version", {})
-        baselines = prop.get("enum", []) if isinstance(prop, dict) else prop
-        return sorted([b.upper() for b in baselines])
+        if self._baselines_cache is None:
+            self._baselines_cache = sorted(map(str.upper, self._enum("version")))
+        return self._baselines_cache[:]
 
     def supports_orbit(self) -> bool:
         """Check if collection supports orbit-based search."""
-        return "sat:absolute_orbit" in self.properties
+        return "sat:absolute_orbit" in self._prop_keys
 
 
 class CatalogQueryablesManager(CatalogManager):
     """Manages catalog queryables download and parsing."""
 
     FILENAME_PATTERN = "{collection}_queryables.json"
-    DEFAULT_DIR = Path(DEFAULT_CATALOG_DIR).expanduser()
     CATALOG_CLASS = CatalogQueryables
 
+    @classmethod
+    @functools.cache
+    def default_dir(cls) -> Path:
+        """Default queryables directory, resolved lazily rather than at import."""
+        return Path(DEFAULT_CATALOG_DIR).expanduser()
+
     def __init__(
         self,
         catalog_url: str = DEFAULT_CATALOG_URL,
@@ -68,45 +131,140 @@ class CatalogQueryablesManager(CatalogManager):
         """
         super().__init__(catalog_dir)
         self._catalog_url = catalog_url.rstrip("/")
+        # Shared across fetches (and download workers) for keep-alive
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        """Close pooled connections to the catalog."""
+        self._session.close()
 
     def fetch(self, collection: str) -> dict[str, Any]:
         """Fetch raw queryables JSON schema directly from MAAP STAC API."""
+        return self.fetch_with_bytes(collection)[0]
+
+    def fetch_with_bytes(self, collection: str) -> tuple[dict[str, Any], bytes]:
+        """Fetch queryables, returning both the parsed schema and the response body."""
         url = f"{self._catalog_url}/collections/{collection}/queryables"
 
         try:
-            r = requests.get(url, timeout=DEFAULT_TIMEOUT)
+            r = self._session.get(url, timeout=DEFAULT_TIMEOUT)
             r.raise_for_status()
-            return r.json()
-        except requests.RequestException as e:
+            # Parse the body bytes directly: no charset detection or
+            # intermediate str (Response.content keeps requests' wrapping
+            # of connection, timeout and decode errors)
+            raw = r.content
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return data, raw
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"[FAIL] {collection}: {e}")
             raise CatalogError(f"Failed to fetch queryables for {collection}: {e}")
 
+    def _fetch_many(
+        self,
+        collections: list[str],
+        max_workers: int,
+    ) -> Iterator[tuple[str, tuple[dict[str, Any], bytes]]]:
+        """
+        Fetch several collections concurrently, yielding in input order.
+
+        With httpx and h2 installed, all requests are multiplexed over one
+        HTTP/2 connection; otherwise they run on a thread pool sharing the
+        requests session.
+        """
+        if httpx is not None and not _loop_running():
+            fetched = asyncio.run(self._fetch_all_http2(collections))
+            for collection, result in zip(collections, fetched):
+                if isinstance(result, BaseException):
+                    raise result
+                yield collection, result
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(collections))) as executor:
+            futures = [(c, executor.submit(self.fetch_with_bytes, c)) for c in collections]
+            for collection, future in futures:
+                yield collection, future.result()
+
+    async def _fetch_all_http2(self, collections: list[str]) -> list[Any]:
+        """Fetch collections over a single HTTP/2 client (results or exceptions)."""
+        async with httpx.AsyncClient(http2=True, timeout=DEFAULT_TIMEOUT) as client:
+            return await asyncio.gather(
+                *(self._fetch_http2(client, c) for c in collections),
+                return_exceptions=True,
+            )
+
+    async def _fetch_http2(
+        self, client: "httpx.AsyncClient", collection: str
+    ) -> tuple[dict[str, Any], bytes]:
+        """HTTP/2 counterpart of fetch_with_bytes()."""
+        url = f"{self._catalog_url}/collections/{collection}/queryables"
+
+        try:
+            r = await client.get(url)
+            r.raise_for_status()
+            raw = r.content
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return data, raw
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"[FAIL] {collection}: {e}")
+            raise CatalogError(f"Failed to fetch queryables for {collection}: {e}")
+
+    def _save_fetched(self, collection: str, data: dict[str, Any], raw: bytes) -> Path:
+        """
+        Save a fetched payload, writing the server bytes as-is when possible.
+
+        The bytes are kept when normalizing could only add the collection
+        name: "properties" is an object, "collection" is absent or matches,
+        and no string list has duplicates to drop. load() sets the
+        collection name either way. Otherwise the normalized catalog is
+        saved.
+        """
+        catalog = CatalogQueryables.from_dict(data)
+        catalog.collection = collection
+        if (
+            data.get("collection", collection) == collection
+            and isinstance(data.get("properties"), dict)
+            and not _has_duplicate_strs(data)
+        ):
+            return self.save_raw(catalog, raw)
+        return self.save(catalog)
+
     def download(
         self,
         collections: Optional[list[str]] = None,
         force: bool = False,
+        max_workers: int = DEFAULT_QUERYABLES_WORKERS,
     ) -> dict[str, Path]:
-        """Download queryables for collections."""
+        """
+        Download queryables for collections.
+
+        Fetches run concurrently on a thread pool; parsing and saving stay
+        on the calling thread, in collection order. The first failed fetch
+        is raised after the collections before it have been saved.
+        """
         if collections is None:
             collections = DEFAULT_COLLECTIONS
 
         results = {}
+        to_fetch = []
+        existing = set() if force else self._present(collections)
 
         for collection in collections:
-            path = self.get_path(collection)
-
-            if path.exists() and not force:
+            if collection in existing:
+                path = self.get_path(collection)
                 logger.debug(f"[SKIP] {collection} already exists: {path}")
                 results[collection] = path
                 continue
+            to_fetch.append(collection)
+
+        if not to_fetch:
+            return results
 
-            data = self.fetch(collection)
-            catalog = CatalogQueryables.from_dict(data)
-            catalog.collection = collection
-            results[collection] = self.save(catalog)
+        for collection, (data, raw) in self._fetch_many(to_fetch, max_workers):
+            results[collection] = self._save_fetched(collection, data, raw)
             logger.info(f"[OK] {collection} -> {results[collection]}")
 
-        return results
+        # Report in the requested order, skipped and fetched interleaved
+        return {c: results[c] for c in collections if c in results}
 
     def load(
         self,
@@ -129,19 +287,24 @@ class CatalogQueryablesManager(CatalogManager):
                 catalog.collection = collection
                 return catalog
 
-        # Fetch from API
-        data = self.fetch(collection)
-        catalog = CatalogQueryables.from_dict(data)
-        catalog.collection = collection
-
-        self.save(catalog)
-        self._cache[collection] = catalog
-        return catalog
+        # Fetch from API (saving also caches it)
+        data, raw = self.fetch_with_bytes(collection)
+        self._save_fetched(collection, data, raw)
+        return self._cache[collection]
 
     def list_downloaded(self) -> list[str]:
         """List collections that have local queryables files."""
-        downloaded = []
-        for collection in DEFAULT_COLLECTIONS:
-            if self.get_path(collection).exists():
-                downloaded.append(collection)
-        return downloaded
+        present = self._present(DEFAULT_COLLECTIONS)
+        return [c for c in DEFAULT_COLLECTIONS if c in present]
+
+    def _present(self, collections: list[str]) -> set[str]:
+        """Collections whose queryables file exists on disk."""
+        # One directory scan instead of a stat() per collection
+        expected = {
+            self.FILENAME_PATTERN.format(collection=c): c for c in collections
+        }
+        try:
+            with os.scandir(self._catalog_dir) as it:
+                return {expected[entry.name] for entry in it if entry.name in expected}
+        except OSError:
+            return {c for c in collections if self.get_path(c).exists()}
@@ -4,24 +4,15 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import Any, Optional
 
-from maap_client.constants import __version__
+from maap_client.constants import (
+    DEFAULT_DOWNLOAD_WORKERS,
+    DEFAULT_QUERYABLES_WORKERS,
+    __version__,
+)
 from maap_client.cli_helpers import frames_arg
 from maap_client.exceptions import classify_exit_code
-from maap_client.cli_commands import (
-    cmd_catalog_update,
-    cmd_catalog_build,
-    cmd_list,
-    cmd_search,
-    cmd_download,
-    cmd_get,
-    cmd_sync,
-    cmd_state_show,
-    cmd_state_pending,
-    cmd_state_mark,
-    cmd_state_cleanup,
-    cmd_config,
-)
 
 
 def setup_logging(verbosity: int = 0, quiet: bool = False) -> None:
@@ -56,6 +47,56 @@ def non_empty_string(value: str) -> str:
     return value
 
 
+_DATE_HELP = "Single date (YYYY-MM-DD) or exact datetime (YYYY-MM-DDTHH:MM:SSZ)"
+_START_HELP = "Start datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
+_END_HELP = "End datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
+_ORBIT_SEARCH_HELP = (
+    "Orbit-based search: orbit number with optional frame letter "
+    "(e.g., '1525' for all frames, '01525F' for one)"
+)
+_FRAME_SEARCH_HELP = (
+    "Frame letter(s) A-H, comma-separated (e.g., 'A' or 'C,D,E'); "
+    "combines with time options or a frame-less --orbit"
+)
+
+
+def _add_time_filters(
+    parser: argparse.ArgumentParser,
+    title: Optional[str] = None,
+    days_back: bool = True,
+    orbit_help: Optional[str] = None,
+    frame_help: Optional[str] = None,
+) -> Any:
+    """
+    Add the shared time filter options to a subcommand parser.
+
+    --date/--days-back/--orbit/--start are mutually exclusive; --end and
+    --frame follow. A helper rather than argparse parents: on Python < 3.12
+    a parent's mutually exclusive group loses its argument group title.
+
+    Returns:
+        The container the options were added to (the titled group, or the
+        parser itself), so callers can append related options.
+    """
+    container = parser.add_argument_group(title) if title else parser
+    exclusive = container.add_mutually_exclusive_group()
+    exclusive.add_argument("--date", help=_DATE_HELP)
+    if days_back:
+        exclusive.add_argument("--days-back", "-d", type=int, help="Days to look back from now")
+    if orbit_help:
+        exclusive.add_argument("--orbit", help=orbit_help)
+    exclusive.add_argument("--start", "-s", help=_START_HELP)
+    container.add_argument("--end", "-e", help=_END_HELP)
+    if frame_help:
+        container.add_argument("--frame", type=frames_arg, help=frame_help)
+    return container
+
+
+def _add_out_dir(container: Any) -> None:
+    """Add the --out-dir/-o option."""
+    container.add_argument("--out-dir", "-o", type=Path, help="Output directory")
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build and return the argument parser."""
     parser = argparse.ArgumentParser(
@@ -115,7 +156,7 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Refresh from API to get latest products/baselines",
     )
-    list_parser.set_defaults(func=cmd_list)
+    list_parser.set_defaults(cmd_name="list")
 
     # --- catalog subcommand (manage catalogs) ---
     catalog_parser = subparsers.add_parser(
@@ -133,10 +174,12 @@ def build_parser() -> argparse.ArgumentParser:
     catalog_update.add_argument(
         "collection", nargs="?", default=None, help="Collection name (if omitted, updates all)"
     )
+    _add_out_dir(catalog_update)
     catalog_update.add_argument(
-        "--out-dir", "-o", type=Path, help="Output directory"
+        "--workers", "-j", type=int, default=DEFAULT_QUERYABLES_WORKERS,
+        help=f"Collections fetched concurrently (default: {DEFAULT_QUERYABLES_WORKERS})",
     )
-    catalog_update.set_defaults(func=cmd_catalog_update)
+    catalog_update.set_defaults(cmd_name="catalog_update")
 
     catalog_build = catalog_sub.add_parser(
         "build",
@@ -167,11 +210,9 @@ def build_parser() -> argparse.ArgumentParser:
 
     # Output options group
     build_output_group = catalog_build.add_argument_group("output options")
-    build_output_group.add_argument(
-        "--out-dir", "-o", type=Path, help="Output directory"
-    )
+    _add_out_dir(build_output_group)
 
-    catalog_build.set_defaults(func=cmd_catalog_build)
+    catalog_build.set_defaults(cmd_name="catalog_build")
 
     # --- search subcommand (unified: time-based or orbit-based) ---
     search_parser = subparsers.add_parser(
@@ -192,29 +233,9 @@ def build_parser() -> argparse.ArgumentParser:
     )
 
     # Filtering options group
-    filter_group = search_parser.add_argument_group("filtering options")
-    filter_exclusive = filter_group.add_mutually_exclusive_group()
-    filter_exclusive.add_argument(
-        "--date", help="Single date (YYYY-MM-DD) or exact datetime (YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_exclusive.add_argument(
-        "--days-back", "-d", type=int, help="Days to look back from now"
-    )
-    filter_exclusive.add_argument(
-        "--orbit",
-        help="Orbit-based search: orbit number with optional frame letter "
-             "(e.g., '1525' for all frames, '01525F' for one)"
-    )
-    filter_exclusive.add_argument(
-        "--start", "-s", help="Start datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_group.add_argument(
-        "--end", "-e", help="End datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_group.add_argument(
-        "--frame", type=frames_arg,
-        help="Frame letter(s) A-H, comma-separated (e.g., 'A' or 'C,D,E'); "
-             "combines with time options or a frame-less --orbit"
+    _add_time_filters(
+        search_parser, "filtering options",
+        orbit_help=_ORBIT_SEARCH_HELP, frame_help=_FRAME_SEARCH_HELP,
     )
 
     # Output options group
@@ -247,7 +268,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--newest-first", action="store_true",
         help="Return URLs sorted newest-first by sensing time",
     )
-    search_parser.set_defaults(func=cmd_search)
+    search_parser.set_defaults(cmd_name="search")
 
     # --- download subcommand ---
     download_parser = subparsers.add_parser(
@@ -279,25 +300,9 @@ Notes:
         help="Search from registry files")
 
     # Filtering options group (only with --registry)
-    filter_group = download_parser.add_argument_group(
-        "filtering options (only with --registry)"
-    )
-    filter_exclusive = filter_group.add_mutually_exclusive_group()
-    filter_exclusive.add_argument(
-        "--date", help="Single date (YYYY-MM-DD) or exact datetime (YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_exclusive.add_argument(
-        "--days-back", "-d", type=int, help="Days to look back from now"
-    )
-    filter_exclusive.add_argument(
-        "--start", "-s", help="Start datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_group.add_argument(
-        "--end", "-e", help="End datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_group.add_argument(
-        "--frame", type=frames_arg,
-        help="Filter registry entries by frame letter(s), matched against filenames"
+    filter_group = _add_time_filters(
+        download_parser, "filtering options (only with --registry)",
+        frame_help="Filter registry entries by frame letter(s), matched against filenames",
     )
     filter_group.add_argument(
         "--orbit",
@@ -307,9 +312,7 @@ Notes:
 
     # Output options group
     output_group = download_parser.add_argument_group("output options")
-    output_group.add_argument(
-        "--out-dir", "-o", type=Path, help="Output directory"
-    )
+    _add_out_dir(output_group)
     output_group.add_argument(
         "--dry-run", action="store_true", help="Show what would be downloaded"
     )
@@ -332,7 +335,11 @@ Notes:
         "--newest-first", action="store_true",
         help="Download newest sensing times first",
     )
-    download_parser.set_defaults(func=cmd_download)
+    other_group.add_argument(
+        "--workers", "-j", type=int, default=DEFAULT_DOWNLOAD_WORKERS,
+        help=f"Maximum concurrent downloads (default: {DEFAULT_DOWNLOAD_WORKERS})",
+    )
+    download_parser.set_defaults(cmd_name="download")
 
     # --- get subcommand ---
     get_parser = subparsers.add_parser(
@@ -357,36 +364,14 @@ Notes:
     )
 
     # Filtering options group
-    filter_group = get_parser.add_argument_group("filtering options")
-    filter_exclusive = filter_group.add_mutually_exclusive_group()
-    filter_exclusive.add_argument(
-        "--date", help="Single date (YYYY-MM-DD) or exact datetime (YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_exclusive.add_argument(
-        "--days-back", "-d", type=int, help="Days to look back from now"
-    )
-    filter_exclusive.add_argument(
-        "--orbit",
-        help="Orbit-based search: orbit number with optional frame letter "
-             "(e.g., '1525' for all frames, '01525F' for one)"
-    )
-    filter_exclusive.add_argument(
-        "--start", "-s", help="Start datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_group.add_argument(
-        "--end", "-e", help="End datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    filter_group.add_argument(
-        "--frame", type=frames_arg,
-        help="Frame letter(s) A-H, comma-separated (e.g., 'A' or 'C,D,E'); "
-             "combines with time options or a frame-less --orbit"
+    _add_time_filters(
+        get_parser, "filtering options",
+        orbit_help=_ORBIT_SEARCH_HELP, frame_help=_FRAME_SEARCH_HELP,
     )
 
     # Output options group
     output_group = get_parser.add_argument_group("output options")
-    output_group.add_argument(
-        "--out-dir", "-o", type=Path, help="Output directory"
-    )
+    _add_out_dir(output_group)
     output_group.add_argument(
         "--dry-run", action="store_true", help="Show what would be downloaded"
     )
@@ -411,7 +396,7 @@ Notes:
         "--newest-first", action="store_true",
         help="Search and download newest sensing times first",
     )
-    get_parser.set_defaults(func=cmd_get)
+    get_parser.set_defaults(cmd_name="get")
 
     # --- sync subcommand ---
     sync_parser = subparsers.add_parser(
@@ -423,22 +408,9 @@ Notes:
     sync_parser.add_argument("product", type=non_empty_string, help="Product type")
     sync_parser.add_argument("baseline", nargs="?", default=None, help="Baseline version (if omitted, syncs all baselines)")
     # Time range options (mutually exclusive modes)
-    sync_time_group = sync_parser.add_mutually_exclusive_group()
-    sync_time_group.add_argument(
-        "--date", help="Single date (YYYY-MM-DD) or exact datetime (YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    sync_time_group.add_argument(
-        "--days-back", "-d", type=int, help="Days to look back from now"
-    )
-    sync_time_group.add_argument(
-        "--start", "-s", help="Start datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    sync_parser.add_argument(
-        "--end", "-e", help="End datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
-    )
-    sync_parser.add_argument(
-        "--frame", type=frames_arg,
-        help="Frame letter(s) A-H, comma-separated; sync only these frames"
+    _add_time_filters(
+        sync_parser,
+        frame_help="Frame letter(s) A-H, comma-separated; sync only these frames",
     )
     sync_parser.add_argument(
         "--max-items",
@@ -447,9 +419,7 @@ Notes:
         default=50000,
         help="Maximum items to synchronize",
     )
-    sync_parser.add_argument(
-        "--out-dir", "-o", type=Path, help="Output directory"
-    )
+    _add_out_dir(sync_parser)
     sync_parser.add_argument(
         "--format",
         choices=["h5", "hdr"],
@@ -464,7 +434,11 @@ Notes:
         "--newest-first", action="store_true",
         help="Search and download newest sensing times first",
     )
-    sync_parser.set_defaults(func=cmd_sync)
+    sync_parser.add_argument(
+        "--workers", "-j", type=int, default=DEFAULT_DOWNLOAD_WORKERS,
+        help=f"Maximum concurrent downloads (default: {DEFAULT_DOWNLOAD_WORKERS})",
+    )
+    sync_parser.set_defaults(cmd_name="sync")
 
     # --- state subcommand ---
     state_parser = subparsers.add_parser(
@@ -482,11 +456,8 @@ Notes:
     state_show.add_argument("collection", type=non_empty_string, help="Collection name")
     state_show.add_argument("product", type=non_empty_string, help="Product type")
     state_show.add_argument("baseline", type=non_empty_string, help="Baseline version")
-    state_show_time = state_show.add_mutually_exclusive_group()
-    state_show_time.add_argument("--date", help="Single date (YYYY-MM-DD) or exact datetime (YYYY-MM-DDTHH:MM:SSZ)")
-    state_show_time.add_argument("--start", "-s", help="Start datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)")
-    state_show.add_argument("--end", "-e", help="End datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)")
-    state_show.set_defaults(func=cmd_state_show)
+    _add_time_filters(state_show, days_back=False)
+    state_show.set_defaults(cmd_name="state_show")
 
     state_pending = state_sub.add_parser(
         "pending",
@@ -502,11 +473,8 @@ Notes:
         default="downloads",
         help="Type of pending items (default: %(default)s)",
     )
-    state_pending_time = state_pending.add_mutually_exclusive_group()
-    state_pending_time.add_argument("--date", help="Single date (YYYY-MM-DD) or exact datetime (YYYY-MM-DDTHH:MM:SSZ)")
-    state_pending_time.add_argument("--start", "-s", help="Start datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)")
-    state_pending.add_argument("--end", "-e", help="End datetime (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)")
-    state_pending.set_defaults(func=cmd_state_pending)
+    _add_time_filters(state_pending, days_back=False)
+    state_pending.set_defaults(cmd_name="state_pending")
 
     state_mark = state_sub.add_parser(
         "mark",
@@ -515,7 +483,7 @@ Notes:
     )
     state_mark.add_argument("paths", nargs="*", help="Local file paths to mark")
     state_mark.add_argument("--file", "-f", type=Path, help="File with paths to mark")
-    state_mark.set_defaults(func=cmd_state_mark)
+    state_mark.set_defaults(cmd_name="state_mark")
 
     state_cleanup = state_sub.add_parser(
         "cleanup",
@@ -526,7 +494,7 @@ Notes:
     state_cleanup.add_argument("product", type=non_empty_string, help="Product type")
     state_cleanup.add_argument("baseline", type=non_empty_string, help="Baseline version")
     state_cleanup.add_argument("--dry-run", action="store_true", help="Show what would be deleted")
-    state_cleanup.set_defaults(func=cmd_state_cleanup)
+    state_cleanup.set_defaults(cmd_name="state_cleanup")
 
     # --- config subcommand ---
     config_parser = subparsers.add_parser(
@@ -534,7 +502,7 @@ Notes:
         help="Show loaded configuration",
         description="Show the currently loaded configuration including all paths and settings.",
     )
-    config_parser.set_defaults(func=cmd_config)
+    config_parser.set_defaults(cmd_name="config")
 
     return parser
 
@@ -547,8 +515,14 @@ def main() -> int:
     args = parser.parse_args()
     setup_logging(args.verbose, args.quiet)
 
+    # Handlers (and the client stack behind them) load only once a
+    # command is known, so --help/--version and bad args stay cheap
+    from maap_client import cli_commands
+
+    func = getattr(cli_commands, f"cmd_{args.cmd_name}")
+
     try:
-        return args.func(args)
+        return func(args)
     except KeyboardInterrupt:
         print("\nInterrupted", file=sys.stderr)
         return 130
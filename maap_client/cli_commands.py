@@ -1,20 +1,68 @@
 """CLI command handlers for MAAP client."""
 
 import argparse
+import functools
+import re
 import sys
+from collections import defaultdict
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Collection
 
-from maap_client import MaapClient, MaapConfig, InvalidRequestError
 from maap_client.cli_helpers import (
     get_client,
+    get_config,
     report_failed_days,
     resolve_date_args,
     validate_download_filter_args,
     validate_time_args,
 )
+from maap_client.constants import DEFAULT_QUERYABLES_WORKERS
 from maap_client.exceptions import classify_exit_code, EXIT_NON_TRANSIENT, EXIT_TRANSIENT
 from maap_client.utils import to_zulu
 
+if TYPE_CHECKING:
+    from maap_client.client import MaapClient
+
+
+@functools.lru_cache(maxsize=8)
+def _structured_path_re(collections: tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Match EarthCARE files in the structured data layout.
+
+    .../collection/product/baseline/yyyy/mm/dd/[stem/]filename, where the
+    product and baseline directories agree with the filename, so the
+    groups give the same key extract_info() would.
+    """
+    names = "|".join(map(re.escape, sorted(collections, key=len, reverse=True)))
+    return re.compile(
+        rf"(?:^|/)(?P<collection>{names})/(?P<product>[^/]+)/(?P<baseline>[A-Z]{{2}})"
+        rf"/\d{{4}}/\d{{2}}/\d{{2}}/(?:[^/]+/)?"
+        rf"ECA_[A-Z]{{2}}(?P=baseline)_(?P=product)_\d{{8}}T\d{{6}}Z_[^/]*$"
+    )
+
+
+def _print_lines(lines: Collection[str]) -> None:
+    """Print one item per line with a single write to stdout."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _cli_error_boundary(
+    handler: Callable[[argparse.Namespace], int],
+) -> Callable[[argparse.Namespace], int]:
+    """Report a handler's exceptions as 'Error: ...' with a classified exit code."""
+    @functools.wraps(handler)
+    def wrapper(args: argparse.Namespace) -> int:
+        try:
+            return handler(args)
+        except Exception as e:
+            # -vv: let main() show the traceback
+            if getattr(args, 'verbose', 0) >= 2:
+                raise
+            print(f"Error: {e}", file=sys.stderr)
+            return classify_exit_code(e)
+    return wrapper
+
 
 # --- Command handlers ---
 
@@ -25,7 +73,12 @@ def cmd_catalog_update(args: argparse.Namespace) -> int:
 
     collections = [args.collection] if args.collection else None
     out_dir = args.out_dir if hasattr(args, 'out_dir') and args.out_dir else None
-    results = client.update_catalogs(collections=collections, force=True, out_dir=out_dir)
+    results = client.update_catalogs(
+        collections=collections,
+        force=True,
+        out_dir=out_dir,
+        max_workers=getattr(args, 'workers', DEFAULT_QUERYABLES_WORKERS),
+    )
 
     for collection, path in results.items():
         print(f"{path}")
@@ -35,6 +88,7 @@ def cmd_catalog_update(args: argparse.Namespace) -> int:
     return 0
 
 
+@_cli_error_boundary
 def cmd_catalog_build(args: argparse.Namespace) -> int:
     """Handle 'catalog build' command."""
     client = get_client(args)
@@ -42,96 +96,78 @@ def cmd_catalog_build(args: argparse.Namespace) -> int:
     # Use config's built_catalog_dir if --out-dir not specified
     out_dir = args.out_dir if args.out_dir else None
 
-    try:
-        failures: list[tuple[str, str, str, str]] = []
-        results = client.build_catalog(
-            collection=args.collection,
-            product_type=args.product,
-            baseline=args.baseline,
-            latest_baseline=getattr(args, 'latest_baseline', False),
-            force=getattr(args, 'force', False),
-            out_dir=out_dir,
-            verbose=getattr(args, 'verbose', 0) >= 1,
-            failures_out=failures,
+    failures: list[tuple[str, str, str, str]] = []
+    results = client.build_catalog(
+        collection=args.collection,
+        product_type=args.product,
+        baseline=args.baseline,
+        latest_baseline=getattr(args, 'latest_baseline', False),
+        force=getattr(args, 'force', False),
+        out_dir=out_dir,
+        verbose=getattr(args, 'verbose', 0) >= 1,
+        failures_out=failures,
+    )
+
+    for collection, path in results.items():
+        print(f"Wrote catalog to {path}")
+
+    if failures:
+        print(f"{len(failures)} baseline(s) failed after retries:", file=sys.stderr)
+        for coll, prod, baseline, err in failures:
+            print(f"  {coll}/{prod}/{baseline}: {err}", file=sys.stderr)
+        print(
+            "Re-run the same command to fill only the gaps "
+            "(if a baseline was deleted on the server, use --force).",
+            file=sys.stderr,
         )
+        return EXIT_TRANSIENT
 
-        for collection, path in results.items():
-            print(f"Wrote catalog to {path}")
-
-        if failures:
-            print(f"{len(failures)} baseline(s) failed after retries:", file=sys.stderr)
-            for coll, prod, baseline, err in failures:
-                print(f"  {coll}/{prod}/{baseline}: {err}", file=sys.stderr)
-            print(
-                "Re-run the same command to fill only the gaps "
-                "(if a baseline was deleted on the server, use --force).",
-                file=sys.stderr,
-            )
-            return EXIT_TRANSIENT
+    return 0
 
-        return 0
 
-    except InvalidRequestError as e:
+def _list_collections(client: "MaapClient", args: argparse.Namespace) -> int:
+    """List level 0: configured collections."""
+    _print_lines(client.config.collections)
+    return 0
+
+
+def _list_products(client: "MaapClient", args: argparse.Namespace) -> int:
+    """List level 1: products of a collection (from queryables)."""
+    from maap_client.exceptions import CatalogError
+
+    try:
+        verify = getattr(args, 'verify', False)
+        products = client.list_products(args.collection, from_built=False, verify=verify)
+        _print_lines(products)
+        return 0
+    except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         return EXIT_NON_TRANSIENT
-    except Exception as e:
+    except CatalogError as e:
         print(f"Error: {e}", file=sys.stderr)
         return classify_exit_code(e)
 
 
-def cmd_list(args: argparse.Namespace) -> int:
-    """
-    Handle 'list' command with hierarchical behavior.
-
-    0 args: list collections
-    1 arg:  list products from queryables
-    2 args: list baselines from built catalog
-    3 args: show baseline info from built catalog
-    """
-    from maap_client.exceptions import CatalogError
-
-    client = get_client(args)
-
-    # Level 0: List collections
-    if args.collection is None:
-        for collection in client.list_collections():
-            print(collection)
+def _list_baselines(client: "MaapClient", args: argparse.Namespace) -> int:
+    """List level 2: baselines of a product (from the built catalog)."""
+    try:
+        verify = getattr(args, 'verify', False)
+        baselines = client.list_baselines(args.collection, args.product, from_built=True, verify=verify)
+        # If --latest-baseline, print only the alphabetically last one
+        if getattr(args, 'latest_baseline', False):
+            latest = max(baselines, default=None)
+            if latest is not None:
+                print(latest)
+        else:
+            _print_lines(baselines)
         return 0
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_NON_TRANSIENT
 
-    # Level 1: List products (from queryables)
-    if args.product is None:
-        try:
-            verify = getattr(args, 'verify', False)
-            products = client.list_products(args.collection, from_built=False, verify=verify)
-            for product in products:
-                print(product)
-            return 0
-        except FileNotFoundError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return EXIT_NON_TRANSIENT
-        except CatalogError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return classify_exit_code(e)
-
-    # Level 2: List baselines (from queryables)
-    if args.baseline is None:
-        try:
-            verify = getattr(args, 'verify', False)
-            baselines = client.list_baselines(args.collection, args.product, from_built=True, verify=verify)
-            # If --latest-baseline, sort alphabetically and return only the last one
-            if getattr(args, 'latest_baseline', False):
-                baselines = sorted(baselines)
-                if baselines:
-                    print(baselines[-1])
-            else:
-                for baseline in baselines:
-                    print(baseline)
-            return 0
-        except (FileNotFoundError, ValueError) as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return EXIT_NON_TRANSIENT
 
-    # Level 3: Show baseline info
+def _show_baseline_info(client: "MaapClient", args: argparse.Namespace) -> int:
+    """List level 3: summary of one baseline (from the built catalog)."""
     baseline_info = client.get_baseline_info(
         args.collection,
         args.product,
@@ -160,6 +196,28 @@ def cmd_list(args: argparse.Namespace) -> int:
     return 0
 
 
+# cmd_list handlers, indexed by the number of positional arguments given
+_LIST_LEVELS = (_list_collections, _list_products, _list_baselines, _show_baseline_info)
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    """
+    Handle 'list' command with hierarchical behavior.
+
+    0 args: list collections
+    1 arg:  list products from queryables
+    2 args: list baselines from built catalog
+    3 args: show baseline info from built catalog
+    """
+    client = get_client(args)
+
+    # Positionals are optional left to right, so the first None is the level
+    positionals = (args.collection, args.product, args.baseline)
+    level = next((i for i, value in enumerate(positionals) if value is None), 3)
+    return _LIST_LEVELS[level](client, args)
+
+
+@_cli_error_boundary
 def cmd_search(args: argparse.Namespace) -> int:
     """Handle 'search' command (unified: time-based or orbit-based)."""
     client = get_client(args)
@@ -191,31 +249,23 @@ def cmd_search(args: argparse.Namespace) -> int:
             accumulated_new_count += n
             accumulated_files.extend(f for f in files if f not in accumulated_files)
 
-    try:
-        # Use facade search() method
-        result = client.search(
-            collection=args.collection,
-            product_type=args.product,
-            baseline=args.baseline,
-            start=start,
-            end=end,
-            orbit=orbit,
-            frames=getattr(args, 'frame', None),
-            use_catalog=use_catalog,
-            max_items=args.max_items,
-            verbose=getattr(args, 'verbose', 0) >= 1,
-            format=getattr(args, 'format', None),
-            reverse=getattr(args, 'newest_first', False),
-            on_day=on_day,
-        )
-        urls = result.urls
-
-    except InvalidRequestError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return EXIT_NON_TRANSIENT
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return classify_exit_code(e)
+    # Use facade search() method
+    result = client.search(
+        collection=args.collection,
+        product_type=args.product,
+        baseline=args.baseline,
+        start=start,
+        end=end,
+        orbit=orbit,
+        frames=getattr(args, 'frame', None),
+        use_catalog=use_catalog,
+        max_items=args.max_items,
+        verbose=getattr(args, 'verbose', 0) >= 1,
+        format=getattr(args, 'format', None),
+        reverse=getattr(args, 'newest_first', False),
+        on_day=on_day,
+    )
+    urls = result.urls
 
     # Save to registry if requested. When on_day already saved incrementally
     # (long ranges), this final call covers only leftovers from the ≤10-day
@@ -241,19 +291,20 @@ def cmd_search(args: argparse.Namespace) -> int:
 
     # Handle output
     if args.url_file:
-        with open(args.url_file, "w") as f:
-            for url in urls:
-                f.write(url + "\n")
+        # URLs are ASCII: encode once and write bytes, bypassing the text layer
+        payload = ("\n".join(urls) + "\n").encode() if urls else b""
+        with open(args.url_file, "wb") as f:
+            f.write(payload)
         print(f"Wrote {len(urls)} URLs to {args.url_file}")
     elif not registry_save:
         # Print to stdout if not saved to registry
-        for url in urls:
-            print(url)
+        _print_lines(urls)
 
     report_failed_days(result.failed_days)
     return EXIT_TRANSIENT if result.failed_days else 0
 
 
+@_cli_error_boundary
 def cmd_download(args: argparse.Namespace) -> int:
     """Handle 'download' command."""
     client = get_client(args)
@@ -270,86 +321,82 @@ def cmd_download(args: argparse.Namespace) -> int:
             print(f"Error: {validation_error}", file=sys.stderr)
             return EXIT_NON_TRANSIENT
 
-    try:
-        # Download from registry
-        if args.registry:
-            start, end = resolve_date_args(args)
-            if start or end:
-                start, end = client.normalize_time_range(start, end)
-
-            result = client.download_from_registry(
-                collection=args.collection,
-                product_type=args.product,
-                baseline=args.baseline,
-                start=start,
-                end=end,
-                orbit=getattr(args, 'orbit', None),
-                frames=getattr(args, 'frame', None),
-                out_dir=args.out_dir,
-                dry_run=args.dry_run,
-                verbose=getattr(args, 'verbose', 0) >= 1,
-                product_dir=getattr(args, 'product_dir', False),
-                reverse=getattr(args, 'newest_first', False),
-            )
+    # Download from registry
+    if args.registry:
+        start, end = resolve_date_args(args)
+        if start or end:
+            start, end = client.normalize_time_range(start, end)
 
-        # Download from single URL
-        elif args.url:
-            result = client.download(
-                urls=[args.url],
-                collection=args.collection,
-                out_dir=args.out_dir,
-                dry_run=args.dry_run,
-                verbose=getattr(args, 'verbose', 0) >= 1,
-                product_dir=getattr(args, 'product_dir', False),
-                reverse=getattr(args, 'newest_first', False),
-            )
+        result = client.download_from_registry(
+            collection=args.collection,
+            product_type=args.product,
+            baseline=args.baseline,
+            start=start,
+            end=end,
+            orbit=getattr(args, 'orbit', None),
+            frames=getattr(args, 'frame', None),
+            out_dir=args.out_dir,
+            dry_run=args.dry_run,
+            verbose=getattr(args, 'verbose', 0) >= 1,
+            product_dir=getattr(args, 'product_dir', False),
+            reverse=getattr(args, 'newest_first', False),
+            max_workers=getattr(args, 'workers', 1),
+        )
 
-        # Download from URL file
-        elif args.url_file:
-            from maap_client.registry import read_pairs_file
-            if not args.url_file.exists():
-                print(f"Error: URL file not found: {args.url_file}", file=sys.stderr)
-                return EXIT_NON_TRANSIENT
-            try:
-                url_records = read_pairs_file(args.url_file)
-            except OSError as e:
-                print(f"Error: {e}", file=sys.stderr)
-                return EXIT_NON_TRANSIENT
-            urls = [url for url, _ in url_records]
-            result = client.download(
-                urls=urls,
-                collection=args.collection,
-                out_dir=args.out_dir,
-                dry_run=args.dry_run,
-                verbose=getattr(args, 'verbose', 0) >= 1,
-                product_dir=getattr(args, 'product_dir', False),
-                reverse=getattr(args, 'newest_first', False),
-            )
+    # Download from single URL
+    elif args.url:
+        result = client.download(
+            urls=[args.url],
+            collection=args.collection,
+            out_dir=args.out_dir,
+            dry_run=args.dry_run,
+            verbose=getattr(args, 'verbose', 0) >= 1,
+            product_dir=getattr(args, 'product_dir', False),
+            reverse=getattr(args, 'newest_first', False),
+            max_workers=getattr(args, 'workers', 1),
+        )
 
-        else:
-            print("Error: No URL source specified (--registry, --url, or --url-file)", file=sys.stderr)
+    # Download from URL file
+    elif args.url_file:
+        from maap_client.registry import iter_pairs_file
+        if not args.url_file.exists():
+            print(f"Error: URL file not found: {args.url_file}", file=sys.stderr)
             return EXIT_NON_TRANSIENT
+        try:
+            # Keep only the URLs; no intermediate list of (url, path) pairs
+            urls = [url for url, _ in iter_pairs_file(args.url_file)]
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return EXIT_NON_TRANSIENT
+        result = client.download(
+            urls=urls,
+            collection=args.collection,
+            out_dir=args.out_dir,
+            dry_run=args.dry_run,
+            verbose=getattr(args, 'verbose', 0) >= 1,
+            product_dir=getattr(args, 'product_dir', False),
+            reverse=getattr(args, 'newest_first', False),
+            max_workers=getattr(args, 'workers', 1),
+        )
 
-        # Report results
-        for error in result.errors:
-            print(f"Error: {error}", file=sys.stderr)
-        for error in result.permanent_errors:
-            print(f"Error: {error}", file=sys.stderr)
+    else:
+        print("Error: No URL source specified (--registry, --url, or --url-file)", file=sys.stderr)
+        return EXIT_NON_TRANSIENT
 
-        if result.errors:
-            return EXIT_TRANSIENT
-        if result.permanent_errors:
-            return EXIT_NON_TRANSIENT
-        return 0
+    # Report results
+    for error in result.errors:
+        print(f"Error: {error}", file=sys.stderr)
+    for error in result.permanent_errors:
+        print(f"Error: {error}", file=sys.stderr)
 
-    except InvalidRequestError as e:
-        print(f"Error: {e}", file=sys.stderr)
+    if result.errors:
+        return EXIT_TRANSIENT
+    if result.permanent_errors:
         return EXIT_NON_TRANSIENT
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return classify_exit_code(e)
+    return 0
 
 
+@_cli_error_boundary
 def cmd_get(args: argparse.Namespace) -> int:
     """Handle 'get' command (search + download in one step)."""
     client = get_client(args)
@@ -362,45 +409,39 @@ def cmd_get(args: argparse.Namespace) -> int:
 
     orbit = getattr(args, 'orbit', None)
 
-    try:
-        start, end = resolve_date_args(args) if not orbit else (None, None)
-        result = client.get(
-            collection=args.collection,
-            product_type=args.product,
-            baseline=args.baseline,
-            start=start,
-            end=end,
-            orbit=orbit,
-            frames=getattr(args, 'frame', None),
-            out_dir=getattr(args, 'out_dir', None),
-            max_items=args.max_items,
-            dry_run=getattr(args, 'dry_run', False),
-            verbose=getattr(args, 'verbose', 0) >= 1,
-            format=getattr(args, 'format', None),
-            product_dir=getattr(args, 'product_dir', False),
-            reverse=getattr(args, 'newest_first', False),
-        )
+    start, end = resolve_date_args(args) if not orbit else (None, None)
+    result = client.get(
+        collection=args.collection,
+        product_type=args.product,
+        baseline=args.baseline,
+        start=start,
+        end=end,
+        orbit=orbit,
+        frames=getattr(args, 'frame', None),
+        out_dir=getattr(args, 'out_dir', None),
+        max_items=args.max_items,
+        dry_run=getattr(args, 'dry_run', False),
+        verbose=getattr(args, 'verbose', 0) >= 1,
+        format=getattr(args, 'format', None),
+        product_dir=getattr(args, 'product_dir', False),
+        reverse=getattr(args, 'newest_first', False),
+    )
 
-        # Report results
-        for error in result.errors:
-            print(f"Error: {error}", file=sys.stderr)
-        for error in result.permanent_errors:
-            print(f"Error: {error}", file=sys.stderr)
+    # Report results
+    for error in result.errors:
+        print(f"Error: {error}", file=sys.stderr)
+    for error in result.permanent_errors:
+        print(f"Error: {error}", file=sys.stderr)
 
-        report_failed_days(result.failed_days)
-        if result.errors or result.failed_days:
-            return EXIT_TRANSIENT
-        if result.permanent_errors:
-            return EXIT_NON_TRANSIENT
-        return 0
-    except InvalidRequestError as e:
-        print(f"Error: {e}", file=sys.stderr)
+    report_failed_days(result.failed_days)
+    if result.errors or result.failed_days:
+        return EXIT_TRANSIENT
+    if result.permanent_errors:
         return EXIT_NON_TRANSIENT
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return classify_exit_code(e)
+    return 0
 
 
+@_cli_error_boundary
 def cmd_sync(args: argparse.Namespace) -> int:
     """Handle 'sync' command (crontab-friendly incremental sync)."""
     # Validate time arguments
@@ -409,49 +450,48 @@ def cmd_sync(args: argparse.Namespace) -> int:
         print(f"Error: {validation_error}", file=sys.stderr)
         return EXIT_NON_TRANSIENT
 
-    # Handle --out-dir override
-    if args.out_dir:
-        config = MaapConfig.load(args.config) if args.config else MaapConfig.load()
-        config.data_dir = args.out_dir
-        client = MaapClient(config)
-    else:
-        client = get_client(args)
+    # --out-dir overrides the data directory
+    client = get_client(args, data_dir=args.out_dir)
 
     # Calculate time range
     start, end = resolve_date_args(args)
 
-    try:
-        # Use facade sync() method
-        result = client.sync(
-            collection=args.collection,
-            product_type=args.product,
-            baseline=args.baseline,
-            start=start,
-            end=end,
-            frames=getattr(args, 'frame', None),
-            max_items=args.max_items,
-            verbose=getattr(args, 'verbose', 0) >= 1,
-            format=getattr(args, 'format', None),
-            product_dir=getattr(args, 'product_dir', False),
-            reverse=getattr(args, 'newest_first', False),
-        )
+    # Use facade sync() method
+    result = client.sync(
+        collection=args.collection,
+        product_type=args.product,
+        baseline=args.baseline,
+        start=start,
+        end=end,
+        frames=getattr(args, 'frame', None),
+        max_items=args.max_items,
+        verbose=getattr(args, 'verbose', 0) >= 1,
+        format=getattr(args, 'format', None),
+        product_dir=getattr(args, 'product_dir', False),
+        reverse=getattr(args, 'newest_first', False),
+        max_workers=args.workers,
+    )
 
-        # Report results
-        if result.errors:
-            for error in result.errors:
-                print(f"Error: {error}", file=sys.stderr)
+    # Report results
+    if result.errors:
+        for error in result.errors:
+            print(f"Error: {error}", file=sys.stderr)
 
-        report_failed_days(result.failed_days)
-        if result.errors or result.failed_days:
-            return EXIT_TRANSIENT
-        return 0
+    report_failed_days(result.failed_days)
+    if result.errors or result.failed_days:
+        return EXIT_TRANSIENT
+    return 0
 
-    except InvalidRequestError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return EXIT_NON_TRANSIENT
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return classify_exit_code(e)
+
+_STATE_SHOW_TEMPLATE = (
+    "{header}:\n"
+    "Total URLs:          {total_urls}\n"
+    "Downloaded:          {downloaded}\n"
+    "Marked:              {marked}\n"
+    "Errors:              {errors}\n"
+    "Pending downloads:   {pending_downloads}\n"
+    "Pending marks:       {pending_marks}\n"
+)
 
 
 def cmd_state_show(args: argparse.Namespace) -> int:
@@ -469,13 +509,7 @@ def cmd_state_show(args: argparse.Namespace) -> int:
         start_str = to_zulu(start) if start else "..."
         end_str = to_zulu(end) if end else "..."
         header += f"({start_str} to {end_str})"
-    print(f"{header}:")
-    print(f"Total URLs:          {stats['total_urls']}")
-    print(f"Downloaded:          {stats['downloaded']}")
-    print(f"Marked:              {stats['marked']}")
-    print(f"Errors:              {stats['errors']}")
-    print(f"Pending downloads:   {stats['pending_downloads']}")
-    print(f"Pending marks:       {stats['pending_marks']}")
+    sys.stdout.write(_STATE_SHOW_TEMPLATE.format(header=header, **stats))
 
     return 0
 
@@ -490,21 +524,16 @@ def cmd_state_pending(args: argparse.Namespace) -> int:
 
     if args.type == "downloads":
         # Return URLs for downloading
-        pending = sorted(tracker.get_pending_downloads(start, end))
-        for url in pending:
-            print(url)
+        _print_lines(sorted(tracker.get_pending_downloads(start, end)))
     else:
         # Return paths for marking/processing
-        pending = tracker.get_pending_mark_paths(start, end)
-        for path in pending:
-            print(path)
+        _print_lines(tracker.get_pending_mark_paths(start, end))
 
     return 0
 
 
 def cmd_state_mark(args: argparse.Namespace) -> int:
     """Handle 'state mark' command."""
-    from pathlib import Path
     from maap_client.paths import extract_info
 
     client = get_client(args)
@@ -514,11 +543,12 @@ def cmd_state_mark(args: argparse.Namespace) -> int:
     items = []
     if args.file:
         try:
-            with open(args.file, "r") as f:
-                items = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+            lines = Path(args.file).read_text().splitlines()
         except OSError as e:
             print(f"Error: {e}", file=sys.stderr)
             return EXIT_NON_TRANSIENT
+        # Comments are lines starting with '#' before stripping
+        items = [item for line in lines if (item := line.strip()) and not line.startswith("#")]
     if args.paths:
         items.extend(args.paths)
 
@@ -527,29 +557,30 @@ def cmd_state_mark(args: argparse.Namespace) -> int:
         return EXIT_NON_TRANSIENT
 
     # Group items by (collection, product, baseline)
-    items_by_key: dict[tuple[str, str, str], list[str]] = {}
+    items_by_key: defaultdict[tuple[str, str, str], list[str]] = defaultdict(list)
+    path_re = _structured_path_re(tuple(collections))
+    collection_names = frozenset(collections)
 
     for item in items:
+        # Fast path: one regex match for files in the structured layout
+        # (unless an earlier path part is also a collection name)
+        m = path_re.search(item)
+        if m and collection_names.isdisjoint(item[:m.start()].split("/")):
+            items_by_key[m.group("collection", "product", "baseline")].append(item)
+            continue
+
         info = extract_info(item)
         if info["product_type"] is None or info["baseline"] is None:
             print(f"Error: cannot parse path: {item}", file=sys.stderr)
             return EXIT_NON_TRANSIENT
 
-        # Extract collection from path parts
-        collection = None
-        for part in Path(item).parts:
-            if part in collections:
-                collection = part
-                break
+        # Extract collection from path parts (first one that is a known collection)
+        collection = next((p for p in item.split("/") if p in collection_names), None)
         if collection is None:
             print(f"Error: cannot extract collection from path: {item}", file=sys.stderr)
             return EXIT_NON_TRANSIENT
 
-        key = (collection, info["product_type"], info["baseline"])
-
-        if key not in items_by_key:
-            items_by_key[key] = []
-        items_by_key[key].append(item)
+        items_by_key[(collection, info["product_type"], info["baseline"])].append(item)
 
     # Process each group
     marked = 0
@@ -558,12 +589,11 @@ def cmd_state_mark(args: argparse.Namespace) -> int:
     for (collection, product, baseline), paths in items_by_key.items():
         tracker = client.get_tracker(collection, product, baseline)
 
-        for path in paths:
-            if tracker.mark(path):
-                marked += 1
-            else:
-                print(f"Warning: could not extract date from path: {path}", file=sys.stderr)
-                failed += 1
+        ok, failed_paths = tracker.mark_many(paths)
+        marked += ok
+        for path in failed_paths:
+            print(f"Warning: could not extract date from path: {path}", file=sys.stderr)
+        failed += len(failed_paths)
 
     print(f"Marked {marked} files", file=sys.stderr)
     if failed:
@@ -590,7 +620,7 @@ def cmd_state_cleanup(args: argparse.Namespace) -> int:
 
 def cmd_config(args: argparse.Namespace) -> int:
     """Handle 'config' command - show loaded configuration."""
-    config = MaapConfig.load(args.config) if args.config else MaapConfig.load()
+    config = get_config(args)
 
     print("Loaded configuration:")
     print(f"data_dir:          {config.data_dir}")
@@ -600,6 +630,9 @@ def cmd_config(args: argparse.Namespace) -> int:
     print(f"credentials_file:  {config.credentials_file}")
     print(f"catalog_url:       {config.catalog_url}")
     print(f"token_url:         {config.token_url}")
+    print(f"pool_maxsize:      {config.pool_maxsize}")
+    print(f"range_parts:       {config.range_parts}")
+    print(f"chunk_size:        {config.chunk_size}")
     print(f"mission:           {config.mission}")
     print(f"mission_start:     {config.mission_start}")
     print(f"mission_end:       {config.mission_end}")
@@ -5,25 +5,61 @@ Business logic has been moved to MaapClient facade methods.
 """
 
 import argparse
+import functools
+import re
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from maap_client import MaapClient, MaapConfig
 from maap_client.utils import parse_datetime, parse_frames, parse_orbit
 
+if TYPE_CHECKING:
+    from maap_client.client import MaapClient
+    from maap_client.config import MaapConfig
 
-def get_client(args: argparse.Namespace) -> MaapClient:
-    """Create MaapClient from parsed arguments."""
-    config = MaapConfig.load(args.config) if args.config else MaapConfig.load()
+
+@functools.lru_cache(maxsize=8)
+def _build_client(config_path: Optional[Path], data_dir: Optional[Path]) -> "MaapClient":
+    """Load the config and build a MaapClient once per (config, data_dir)."""
+    # Imported here so building the parser (frames_arg) doesn't load the client
+    from maap_client.client import MaapClient
+    from maap_client.config import MaapConfig
+
+    config = MaapConfig.load(config_path) if config_path else MaapConfig.load()
 
     # Override with CLI args
-    if args.data_dir:
-        config.data_dir = args.data_dir
+    if data_dir:
+        config.data_dir = data_dir
 
     return MaapClient(config)
 
 
+def get_client(args: argparse.Namespace, data_dir: Optional[Path] = None) -> "MaapClient":
+    """
+    Create MaapClient from parsed arguments.
+
+    Args:
+        args: Parsed argparse namespace
+        data_dir: Overrides --data-dir (e.g. sync --out-dir)
+    """
+    return _build_client(args.config, data_dir or args.data_dir)
+
+
+def get_config(args: argparse.Namespace) -> "MaapConfig":
+    """Configuration for --config, without the --data-dir override."""
+    return _build_client(args.config, None).config
+
+
+_DAY_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})\Z")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_dt(value: str) -> datetime:
+    """parse_datetime(), memoized: validation and resolution parse the same strings."""
+    return parse_datetime(value)
+
+
 def resolve_date_args(args: argparse.Namespace) -> tuple[Optional[datetime], Optional[datetime]]:
     """
     Resolve --date, --days-back, or --start/--end to (start, end) datetimes.
@@ -38,12 +74,17 @@ def resolve_date_args(args: argparse.Namespace) -> tuple[Optional[datetime], Opt
     """
     # --date mode
     if hasattr(args, 'date') and args.date:
+        # Common case: a plain YYYY-MM-DD day, built directly
+        m = _DAY_RE.match(args.date)
+        if m:
+            start = datetime(*map(int, m.groups()), tzinfo=timezone.utc)
+            return start, start.replace(hour=23, minute=59, second=59)
         if 'T' in args.date:
-            start = parse_datetime(args.date)
+            start = _parse_dt(args.date)
             end = start + timedelta(minutes=1)
             return start, end
         else:
-            return parse_datetime(f"{args.date}T00:00:00Z"), parse_datetime(f"{args.date}T23:59:59Z")
+            return _parse_dt(f"{args.date}T00:00:00Z"), _parse_dt(f"{args.date}T23:59:59Z")
 
     # --days-back mode
     if getattr(args, 'days_back', None) is not None:
@@ -54,18 +95,34 @@ def resolve_date_args(args: argparse.Namespace) -> tuple[Optional[datetime], Opt
     # --start/--end mode
     start_str = getattr(args, 'start', None)
     end_str = getattr(args, 'end', None)
-    start = parse_datetime(start_str) if start_str else None
+    start = _parse_dt(start_str) if start_str else None
     if end_str:
         if 'T' in end_str:
-            end = parse_datetime(end_str)
+            end = _parse_dt(end_str)
         else:
             # Date-only: set to end of day (23:59:59)
-            end = parse_datetime(f"{end_str}T23:59:59Z")
+            end = _parse_dt(f"{end_str}T23:59:59Z")
     else:
         end = None
     return start, end
 
 
+# Mutually exclusive time options, checked in order: (option, option, error)
+_TIME_ARG_CONFLICTS = (
+    ("date", "start", "--date cannot be used with --start"),
+    ("date", "end", "--date cannot be used with --end (date already specifies full day)"),
+    ("days_back", "date", "--days-back cannot be used with --date"),
+    ("days_back", "start", "--days-back cannot be used with --start"),
+    ("days_back", "end", "--days-back cannot be used with --end"),
+)
+_ORBIT_CONFLICTS = (
+    ("orbit", "date", "--orbit cannot be used with --date"),
+    ("orbit", "start", "--orbit cannot be used with --start"),
+    ("orbit", "end", "--orbit cannot be used with --end"),
+    ("orbit", "days_back", "--orbit cannot be used with --days-back"),
+)
+
+
 def validate_time_args(args: argparse.Namespace, orbit_is_filter: bool = False) -> Optional[str]:
     """
     Validate time-based arguments and return error message if invalid.
@@ -83,48 +140,33 @@ def validate_time_args(args: argparse.Namespace, orbit_is_filter: bool = False)
     Returns:
         Error message string if validation fails, None if valid
     """
-    has_date = bool(getattr(args, 'date', None))
-    has_start = bool(getattr(args, 'start', None))
-    has_end = bool(getattr(args, 'end', None))
-    has_days_back = getattr(args, 'days_back', None) is not None
-    has_orbit = bool(getattr(args, 'orbit', None))
-
-    # --date cannot be used with --start or --end
-    if has_date and has_start:
-        return "--date cannot be used with --start"
-    if has_date and has_end:
-        return "--date cannot be used with --end (date already specifies full day)"
-
-    # --days-back cannot be used with --date, --start, or --end
-    if has_days_back and has_date:
-        return "--days-back cannot be used with --date"
-    if has_days_back and has_start:
-        return "--days-back cannot be used with --start"
-    if has_days_back and has_end:
-        return "--days-back cannot be used with --end"
-
-    # --orbit cannot be used with any time-based options (unless orbit is a
-    # client-side filter, e.g. download --registry, where it's combinable)
-    if not orbit_is_filter:
-        if has_orbit and has_date:
-            return "--orbit cannot be used with --date"
-        if has_orbit and has_start:
-            return "--orbit cannot be used with --start"
-        if has_orbit and has_end:
-            return "--orbit cannot be used with --end"
-        if has_orbit and has_days_back:
-            return "--orbit cannot be used with --days-back"
+    given = {
+        "date": bool(getattr(args, 'date', None)),
+        "start": bool(getattr(args, 'start', None)),
+        "end": bool(getattr(args, 'end', None)),
+        "days_back": getattr(args, 'days_back', None) is not None,
+        "orbit": bool(getattr(args, 'orbit', None)),
+    }
+    if not any(given.values()):
+        return None
+
+    # --orbit cannot be used with any time-based options unless orbit is a
+    # client-side filter (e.g. download --registry), where it's combinable
+    rules = _TIME_ARG_CONFLICTS if orbit_is_filter else _TIME_ARG_CONFLICTS + _ORBIT_CONFLICTS
+    for first, second, message in rules:
+        if given[first] and given[second]:
+            return message
 
     # Validate start <= end if both provided
-    if has_start and has_end:
-        start = parse_datetime(args.start)
-        end = parse_datetime(args.end)
+    if given["start"] and given["end"]:
+        start = _parse_dt(args.start)
+        end = _parse_dt(args.end)
         if start > end:
             return f"--start ({args.start}) must be before --end ({args.end})"
 
     # Validate --orbit format and --frame conflict
     has_frame = bool(getattr(args, 'frame', None))
-    if has_orbit:
+    if given["orbit"]:
         try:
             orbit_num, orbit_letter = parse_orbit(args.orbit)
         except ValueError as e:
@@ -2,16 +2,23 @@
 
 import logging
 import os
+import queue
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, nullcontext
 from datetime import datetime, timedelta, timezone
-from urllib.parse import urlparse
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Callable, Optional
 
-from maap_client.auth import load_credentials, TokenManager
+from maap_client.auth import load_credentials, shared_refresh_executor, TokenManager
 from maap_client.catalog_build import BaselineInfo, CatalogCollectionManager
 from maap_client.catalog_query import CatalogQueryablesManager
 from maap_client.config import MaapConfig
+from maap_client.constants import DEFAULT_QUERYABLES_WORKERS
 from maap_client.download import DownloadManager
 from maap_client.exceptions import (
     AuthenticationError,
@@ -23,19 +30,29 @@ from maap_client.search import MaapSearcher
 from maap_client.tracker import GlobalStateTracker, StateTracker
 from maap_client.paths import (
     extract_baseline,
-    extract_product,
+    extract_product_baseline,
     extract_sensing_time,
     filter_by_orbit_frame,
+    filter_by_sensing_time,
     sort_by_sensing_time,
+    url_filename,
 )
 from maap_client.registry import Registry
 from maap_client.types import DownloadResult, SearchResult, SyncResult
 from maap_client.utils import normalize_time_range as _normalize_time_range
-from maap_client.utils import parse_datetime, parse_frames, parse_orbit, timezone_is_aware, to_zulu
+from maap_client.utils import parse_frames, parse_mission_range, parse_orbit, timezone_is_aware, to_zulu
 
 logger = logging.getLogger(__name__)
 
 
+def _group_urls_by_baseline(urls: list[str]) -> dict[str, list[str]]:
+    """Group URLs by the baseline in their filename ("UNKNOWN" if none), in input order."""
+    groups: defaultdict[str, list[str]] = defaultdict(list)
+    for url in urls:
+        groups[extract_baseline(url.rpartition("/")[2]) or "UNKNOWN"].append(url)
+    return groups
+
+
 class MaapClient:
     """
     High-level client for MAAP EarthCARE data access.
@@ -62,6 +79,21 @@ class MaapClient:
         self._searcher: Optional[MaapSearcher] = None
         self._token_manager: Optional[TokenManager] = None
         self._state: Optional[GlobalStateTracker] = None
+        # Orbit search capability per collection (see _supports_orbit)
+        self._orbit_support: dict[str, bool] = {}
+
+    def close(self) -> None:
+        """Close pooled HTTP connections (authenticated downloads and catalog)."""
+        if self._token_manager is not None:
+            self._token_manager.close()
+        if self._catalog is not None:
+            self._catalog.close()
+
+    def __enter__(self) -> "MaapClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     @property
     def config(self) -> MaapConfig:
@@ -107,18 +139,32 @@ class MaapClient:
             self._token_manager = TokenManager(
                 credentials=credentials,
                 token_url=self._config.token_url,
+                pool_maxsize=self._config.pool_maxsize,
+                executor=shared_refresh_executor(),
             )
         return self._token_manager
 
-    def _get_downloader(self, product_dir: bool = False) -> DownloadManager:
-        """Get download manager."""
+    def _get_downloader(self, product_dir: bool = False, max_workers: int = 1) -> DownloadManager:
+        """Get download manager (close it when done)."""
         return DownloadManager(
             token_manager=self._get_token_manager(),
             data_dir=self._config.data_dir,
             mission=self._config.mission,
             product_dir=product_dir,
+            range_parts=self._config.range_parts,
+            chunk_size=self._config.chunk_size,
+            max_workers=max_workers,
         )
 
+    def _supports_orbit(self, collection: str) -> bool:
+        """Whether a collection supports orbit search (True if it has no queryables)."""
+        supports = self._orbit_support.get(collection)
+        if supports is None:
+            queryables = self.catalog.load(collection)
+            supports = not queryables or queryables.supports_orbit()
+            self._orbit_support[collection] = supports
+        return supports
+
     # === VALIDATION ===
 
     @staticmethod
@@ -138,6 +184,11 @@ class MaapClient:
         Raises:
             InvalidRequestError: If validation fails
         """
+        # Fast path: every check below needs a start or end (an orbit alone,
+        # or no time arguments at all, is always valid)
+        if start is None and end is None:
+            return
+
         # Timezone awareness (prevents subtle bugs from naive datetimes)
         if start is not None and not timezone_is_aware(start):
             raise InvalidRequestError(
@@ -217,22 +268,26 @@ class MaapClient:
         collections: Optional[list[str]] = None,
         force: bool = False,
         out_dir: Optional[Path] = None,
+        max_workers: int = DEFAULT_QUERYABLES_WORKERS,
     ) -> dict[str, Path]:
         """
         Download/update catalog queryables.
+
+        Collections are fetched concurrently, up to max_workers at a time.
         """
         self._config.ensure_directories()
+        self._orbit_support.clear()  # Refreshed queryables may change it
         if out_dir:
             manager = CatalogQueryablesManager(
                 catalog_url=self._config.catalog_url,
                 catalog_dir=out_dir,
             )
-            return manager.download(collections, force)
-        return self.catalog.download(collections, force)
+            return manager.download(collections, force, max_workers=max_workers)
+        return self.catalog.download(collections, force, max_workers=max_workers)
 
     def list_collections(self) -> list[str]:
-        """List all known MAAP collections from config."""
-        return self._config.collections.copy()
+        """List all known MAAP collections from config (a new list each call)."""
+        return list(self._config.collections)
 
     def list_products(
         self,
@@ -291,25 +346,112 @@ class MaapClient:
             manager = CatalogCollectionManager(
                 client=self, catalog_dir=self.config.built_catalog_dir
             )
-            catalog = manager.load(collection)
-            if not catalog:
-                raise FileNotFoundError(
-                    f"Built catalog not found for {collection}. "
-                    f"Run: maap catalog build {collection} {product_type}"
-                )
-            product_info = catalog.get_product(product_type)
-            if not product_info:
-                raise ValueError(
-                    f"Product {product_type} not found in built catalog. "
-                    f"Run: maap catalog build {collection} {product_type}"
-                )
-            return product_info.list_baselines()
+            return self._built_baselines(manager, collection, product_type)
 
         # Catalog Queryables (only if already exist, read-only)
         queryables = self.catalog.load(collection, refresh=False)
 
         return queryables.list_baselines()
 
+    def _built_baselines(
+        self,
+        manager: CatalogCollectionManager,
+        collection: str,
+        product_type: str,
+    ) -> list[str]:
+        """Baselines of a product in the built catalog loaded by manager."""
+        catalog = manager.load(collection)
+        if not catalog:
+            raise FileNotFoundError(
+                f"Built catalog not found for {collection}. "
+                f"Run: maap catalog build {collection} {product_type}"
+            )
+        product_info = catalog.get_product(product_type)
+        if not product_info:
+            raise ValueError(
+                f"Product {product_type} not found in built catalog. "
+                f"Run: maap catalog build {collection} {product_type}"
+            )
+        return product_info.list_baselines()
+
+    def list_baselines_batch(
+        self,
+        items: list[tuple[str, str]],
+        from_built: bool = False,
+        verify: bool = False,
+        max_workers: int = DEFAULT_QUERYABLES_WORKERS,
+    ) -> dict[tuple[str, str], list[str] | Exception]:
+        """
+        List baselines for many (collection, product_type) pairs.
+
+        With verify=True, each distinct collection's queryables are fetched
+        once and the STAC existence checks for all pairs run concurrently.
+        A failing pair maps to its exception instead of aborting the batch.
+
+        Args:
+            items: (collection, product_type) pairs
+            from_built: Read from built catalogs (see list_baselines)
+            verify: Check each baseline against MAAP (see list_baselines)
+            max_workers: Concurrent STAC requests when verifying
+
+        Returns:
+            Dict mapping each pair to its baselines or the exception raised
+        """
+        pairs = list(dict.fromkeys(items))
+        results: dict[tuple[str, str], list[str] | Exception] = {}
+
+        if not verify:
+            # Local reads only; one built-catalog manager for the whole batch
+            # so each collection's catalog is parsed once (self.catalog
+            # already caches the queryables per collection)
+            manager = CatalogCollectionManager(
+                client=self, catalog_dir=self.config.built_catalog_dir
+            ) if from_built else None
+            for collection, product_type in pairs:
+                try:
+                    if manager is not None:
+                        if not product_type:
+                            raise ValueError(
+                                "product_type is required when verify=True or from_built=True"
+                            )
+                        baselines = self._built_baselines(manager, collection, product_type)
+                    else:
+                        baselines = self.list_baselines(collection, product_type)
+                    results[(collection, product_type)] = baselines
+                except Exception as e:
+                    results[(collection, product_type)] = e
+            return results
+
+        searcher = self.searcher
+        _ = searcher.client  # Open the STAC client once, before fanning out
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loads = {
+                collection: executor.submit(self.catalog.load, collection, True)
+                for collection in dict.fromkeys(c for c, _ in pairs)
+            }
+            futures = {}
+            for collection, product_type in pairs:
+                if not product_type:
+                    results[(collection, product_type)] = ValueError(
+                        "product_type is required when verify=True or from_built=True"
+                    )
+                    continue
+                load_error = loads[collection].exception()
+                if load_error is not None:
+                    results[(collection, product_type)] = load_error
+                    continue
+                futures[(collection, product_type)] = executor.submit(
+                    searcher.search_baselines,
+                    collection,
+                    product_type,
+                    candidates=loads[collection].result().list_baselines(),
+                )
+            for pair, future in futures.items():
+                error = future.exception()
+                results[pair] = error if error is not None else future.result()
+
+        return {pair: results[pair] for pair in pairs}
+
     def get_baseline_info(
         self,
         collection: str,
@@ -383,6 +525,31 @@ class MaapClient:
             updated_at=now,
         )
 
+    def try_get_baseline_info(
+        self,
+        collection: str,
+        product_type: str,
+        baseline: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> tuple[int, Optional[BaselineInfo]]:
+        """
+        Get baseline metadata from the API, or (0, None) if there is no data.
+
+        Replaces a separate search_has_any_product() probe before
+        get_baseline_info(): the info lookup already starts with that same
+        existence search, so one call saves a round-trip per range.
+
+        Returns:
+            Tuple of (count, info), with info None when the range is empty
+        """
+        info = self.get_baseline_info(
+            collection, product_type, baseline, start, end, from_built=False
+        )
+        if info is None:
+            return 0, None
+        return info.count, info
+
     # === STATE OPERATIONS ===
 
     def get_tracker(
@@ -425,8 +592,7 @@ class MaapClient:
         Returns:
             Tuple of (start, end) datetimes clamped to valid mission bounds
         """
-        mission_start = parse_datetime(self._config.mission_start)
-        mission_end = parse_datetime(self._config.mission_end)
+        mission_start, mission_end = parse_mission_range(self._config.mission_start, self._config.mission_end)
         return _normalize_time_range(start, end, mission_start, mission_end)
 
     # === REGISTRY OPERATIONS ===
@@ -454,16 +620,9 @@ class MaapClient:
         if not urls:
             return 0, []
 
-        # Group URLs by baseline
-        urls_by_baseline: dict[str, list[str]] = {}
-        for url in urls:
-            filename = os.path.basename(url)
-            bl = extract_baseline(filename) or "UNKNOWN"
-            urls_by_baseline.setdefault(bl, []).append(url)
-
         total_new_count = 0
         all_files_written: list[Path] = []
-        for bl, bl_urls in urls_by_baseline.items():
+        for bl, bl_urls in _group_urls_by_baseline(urls).items():
             registry = Registry(
                 registry_dir=self._config.registry_dir,
                 mission=self._config.mission,
@@ -512,33 +671,40 @@ class MaapClient:
             baselines = [baseline]
         else:
             base_path = registry_dir / "urls" / self._config.mission / collection / product_type
-            if not base_path.exists():
+            # scandir entries carry the d_type, so is_dir() needs no stat
+            # (only symlinks are still followed)
+            try:
+                with os.scandir(base_path) as entries:
+                    baselines = [e.name for e in entries if e.is_dir()]
+            except FileNotFoundError:
                 logger.info(f"No registry files found at {base_path}")
                 return []
-            baselines = [d.name for d in base_path.iterdir() if d.is_dir()]
             if not baselines:
                 logger.info(f"No baseline directories in {base_path}")
                 return []
             logger.info(f"Found baselines: {', '.join(sorted(baselines))}")
 
-        # Load URLs from registry files
-        all_urls: list[str] = []
-        seen: set[str] = set()
-        for bl in baselines:
-            registry = Registry(
+        registries = [
+            Registry(
                 registry_dir=registry_dir,
                 mission=self._config.mission,
                 collection=collection,
                 product_type=product_type,
                 baseline=bl,
             )
-            for url in registry.load_urls(start=start, end=end):
-                if url not in seen:
-                    seen.add(url)
-                    all_urls.append(url)
+            for bl in baselines
+        ]
+
+        # Baseline trees are independent, so read them side by side; merge
+        # in baseline order (dict keys: ordered dedup)
+        all_urls: dict[str, None] = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(registries))) as executor:
+            futures = [executor.submit(r.load_urls, start=start, end=end) for r in registries]
+            for future in futures:
+                all_urls.update(dict.fromkeys(future.result()))
 
         logger.info(f"Found {len(all_urls)} URLs in registry files")
-        return all_urls
+        return list(all_urls)
 
     # === HIGH-LEVEL OPERATIONS ===
 
@@ -598,8 +764,7 @@ class MaapClient:
         # Orbit-based search
         orbit_num, resolved_frames = self._resolve_orbit_frames(orbit, frames)
         if orbit_num is not None:
-            queryables = self.catalog.load(collection)
-            if queryables and not queryables.supports_orbit():
+            if not self._supports_orbit(collection):
                 raise InvalidRequestError(
                     f"Collection '{collection}' does not support orbit search. "
                     f"Use --date or --start/--end instead."
@@ -616,14 +781,9 @@ class MaapClient:
             )
             if reverse:
                 urls = sort_by_sensing_time(urls, reverse=True)
-            # Extract baselines from results
-            baselines_found = list(set(
-                extract_baseline(os.path.basename(url)) or "UNKNOWN"
-                for url in urls
-            ))
             return SearchResult(
                 urls=urls,
-                baselines_found=sorted(baselines_found),
+                baselines_found=sorted(_group_urls_by_baseline(urls)),
                 start=None,
                 end=None,
                 total_count=len(urls),
@@ -657,15 +817,9 @@ class MaapClient:
             on_day=on_day,
         )
 
-        # Extract baselines from results
-        baselines_found = list(set(
-            extract_baseline(os.path.basename(url)) or "UNKNOWN"
-            for url in urls
-        ))
-
         return SearchResult(
             urls=urls,
-            baselines_found=sorted(baselines_found),
+            baselines_found=sorted(_group_urls_by_baseline(urls)),
             start=search_start,
             end=search_end,
             total_count=len(urls),
@@ -683,6 +837,7 @@ class MaapClient:
         verbose: bool = False,
         product_dir: bool = False,
         reverse: bool = False,
+        max_workers: int = 1,
     ) -> DownloadResult:
         """
         Download files from URLs.
@@ -699,17 +854,26 @@ class MaapClient:
             dry_run: Only report what would be downloaded
             verbose: Print progress messages
             product_dir: If True, wrap each file in a subdirectory named after the file stem
+            max_workers: Concurrent downloads: files with out_dir, otherwise
+                split between product/baseline groups and the files within
+                each group (1 = serial)
 
         Returns:
             DownloadResult with downloaded paths, skipped, errors
         """
         result = DownloadResult()
-        start_time = time.time()
+        start_time = time.monotonic()
 
         if not urls:
             logger.info("No URLs to download")
             return result
 
+        # Concatenated search/registry results can repeat URLs
+        unique_urls = list(dict.fromkeys(urls))
+        if len(unique_urls) < len(urls):
+            logger.debug(f"Deduplicated {len(urls) - len(unique_urls)} URLs")
+        urls = unique_urls
+
         if reverse:
             urls = sort_by_sensing_time(urls, reverse=True)
 
@@ -728,84 +892,135 @@ class MaapClient:
         # Download to flat directory (--out-dir)
         if out_dir:
             out_dir.mkdir(parents=True, exist_ok=True)
-            downloader = self._get_downloader(product_dir=product_dir)
             total_urls = len(urls)
+            width = len(str(total_urls))
+            tasks: list[tuple[int, str, str, Path]] = []
 
+            # Paths stay plain strings until a file is actually queued, so
+            # re-runs over mostly existing files build no Path objects
+            out_dir_str = os.fspath(out_dir)
             for i, url in enumerate(urls, 1):
-                parsed_url = urlparse(url)
-                filename = os.path.basename(parsed_url.path)
+                filename = url_filename(url)
                 if product_dir:
-                    stem = Path(filename).stem
-                    output_path = out_dir / stem / filename
+                    output_str = os.path.join(out_dir_str, os.path.splitext(filename)[0], filename)
                 else:
-                    output_path = out_dir / filename
+                    output_str = os.path.join(out_dir_str, filename)
 
-                if skip_existing and output_path.exists():
-                    logger.info(f"[{i:>{len(str(total_urls))}}/{total_urls}] Already exists: {filename}")
+                if skip_existing and os.path.exists(output_str):
+                    logger.debug(f"[{i:>{width}}/{total_urls}] Already exists: {filename}")
                     result.skipped.append(url)
                     continue
-
-                try:
-                    logger.info(f"[{i:>{len(str(total_urls))}}/{total_urls}] Downloading: {filename}")
-                    downloader.download_file(url, output_path)
-                    result.downloaded[url] = output_path
-                except (AuthenticationError, CredentialsError):
-                    # Auth failures doom every remaining download identically:
-                    # propagate so callers can classify.
-                    raise
-                except Exception as e:
-                    result.errors.append(f"{url}: {e}")
-
-            result.elapsed_seconds = time.time() - start_time
+                tasks.append((i, url, filename, Path(output_str)))
+
+            if result.skipped:
+                logger.info(f"Skipping {len(result.skipped)} existing files")
+
+            def fetch(task: tuple[int, str, str, Path]) -> None:
+                i, url, filename, output_path = task
+                logger.debug(f"[{i:>{width}}/{total_urls}] Downloading: {filename}")
+                downloader.download_file(url, output_path)
+
+            # Per-file lines are debug-level; INFO gets a counter about
+            # every 5% of the batch instead
+            total_tasks = len(tasks)
+            progress_every = max(1, total_tasks // 20)
+            task_width = len(str(total_tasks))
+
+            # Downloads overlap on the pool; results are collected in URL order
+            workers = max(1, min(max_workers, total_tasks))
+            with (
+                self._get_downloader(product_dir=product_dir, max_workers=workers) as downloader,
+                ThreadPoolExecutor(max_workers=workers) as executor,
+            ):
+                futures = [(task, executor.submit(fetch, task)) for task in tasks]
+                for done, ((_, url, _, output_path), future) in enumerate(futures, 1):
+                    try:
+                        future.result()
+                        result.downloaded[url] = output_path
+                    except (AuthenticationError, CredentialsError):
+                        # Auth failures doom every remaining download identically:
+                        # propagate so callers can classify.
+                        executor.shutdown(cancel_futures=True)
+                        raise
+                    except Exception as e:
+                        result.errors.append(f"{url}: {e}")
+                    if done % progress_every == 0 or done == total_tasks:
+                        logger.info(f"[{done:>{task_width}}/{total_tasks}] files processed")
+
+            result.elapsed_seconds = time.monotonic() - start_time
             logger.info(f"Downloaded {len(result.downloaded)} files")
             return result
 
         # Download to structured paths (grouped by product/baseline)
-        urls_by_key: dict[tuple[str, str], list[str]] = {}
+        # Per-URL loop: hot callables are bound to locals once
+        urls_by_key: defaultdict[tuple[str, str], list[str]] = defaultdict(list)
+        product_baseline = extract_product_baseline
+        sensing_time = extract_sensing_time
+        permanent_errors = result.permanent_errors
         for url in urls:
-            filename = os.path.basename(url)
-            product = extract_product(filename)
-            baseline = extract_baseline(url) # need to pass url to allow baseline extraction for Aeolus
+            filename = url.rpartition("/")[2]
+            product, baseline = product_baseline(url) # url, not filename: Aeolus baselines live in the path
             if not product or not baseline:
-                result.permanent_errors.append(f"cannot parse product/baseline from {filename}")
+                permanent_errors.append(f"cannot parse product/baseline from {filename}")
                 continue
-            if extract_sensing_time(filename) is None:
+            if sensing_time(filename) is None:
                 # batch_download would silently skip it; a retry cannot fix the name.
-                result.permanent_errors.append(f"cannot parse filename (no sensing time): {filename}")
+                permanent_errors.append(f"cannot parse filename (no sensing time): {filename}")
                 continue
-            urls_by_key.setdefault((product, baseline), []).append(url)
+            urls_by_key[(product, baseline)].append(url)
 
-        downloader = self._get_downloader(product_dir=product_dir)
-        for (product, baseline), group_urls in urls_by_key.items():
-            try:
-                tracker = None
-                if track_state:
-                    tracker = self.state.get_tracker(collection, product, baseline)
-                    tracker.add_urls(group_urls)
+        state = self.state if track_state else None  # Lazy init stays on this thread
+
+        def download_group(product: str, baseline: str, group_urls: list[str]) -> dict[str, Path]:
+            tracker = None
+            if state is not None:
+                tracker = state.get_tracker(collection, product, baseline)
+                tracker.add_urls(group_urls)
 
-                downloaded = downloader.batch_download(
+            # Download records are appended in groups, not one file open each
+            with tracker.transaction() if tracker else nullcontext() as records:
+                return downloader.batch_download(
                     urls=group_urls,
                     collection=collection,
                     product_type=product,
                     baseline=baseline,
                     skip_existing=skip_existing,
-                    on_download=tracker.mark_downloaded if tracker else None,
+                    on_download=records.mark_downloaded if records else None,
                     verbose=verbose,
+                    max_workers=file_workers,
                 )
-                result.downloaded.update(downloaded)
-                # batch_download's mapping includes successes and skipped
-                # files; anything absent failed and must reach the caller.
-                for u in group_urls:
-                    if u not in downloaded:
-                        result.errors.append(f"{u}: download failed")
-            except (AuthenticationError, CredentialsError):
-                # Auth failures doom every remaining download identically:
-                # propagate so callers can classify.
-                raise
-            except Exception as e:
-                result.errors.append(f"{product}/{baseline}: {e}")
 
-        result.elapsed_seconds = time.time() - start_time
+        # Groups write to disjoint state files, so they can run side by side;
+        # results are collected in group order. Whatever the group count
+        # leaves of the worker budget goes to files within each group.
+        workers = max(1, min(max_workers, len(urls_by_key)))
+        file_workers = max(1, max_workers // workers)
+        with (
+            self._get_downloader(product_dir=product_dir, max_workers=workers * file_workers) as downloader,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            futures = [
+                (key, group_urls, executor.submit(download_group, *key, group_urls))
+                for key, group_urls in urls_by_key.items()
+            ]
+            for (product, baseline), group_urls, future in futures:
+                try:
+                    downloaded = future.result()
+                    result.downloaded.update(downloaded)
+                    # batch_download's mapping includes successes and skipped
+                    # files; anything absent failed and must reach the caller.
+                    for u in group_urls:
+                        if u not in downloaded:
+                            result.errors.append(f"{u}: download failed")
+                except (AuthenticationError, CredentialsError):
+                    # Auth failures doom every remaining download identically:
+                    # propagate so callers can classify.
+                    executor.shutdown(cancel_futures=True)
+                    raise
+                except Exception as e:
+                    result.errors.append(f"{product}/{baseline}: {e}")
+
+        result.elapsed_seconds = time.monotonic() - start_time
         logger.info(f"Downloaded {len(result.downloaded)} files")
         return result
 
@@ -824,6 +1039,7 @@ class MaapClient:
         reverse: bool = False,
         orbit: Optional[str] = None,
         frames: Optional[list[str]] = None,
+        max_workers: int = 1,
     ) -> DownloadResult:
         """
         Download files from registry.
@@ -844,6 +1060,7 @@ class MaapClient:
                   '01525E'); if it already includes a frame letter, frames must
                   be omitted
             frames: Optional frame letters to filter registry URLs by
+            max_workers: Concurrent downloads, as in download() (1 = serial)
 
         Raises:
             InvalidRequestError: If start > end, datetimes not timezone-aware, or
@@ -876,6 +1093,7 @@ class MaapClient:
             verbose=verbose,
             product_dir=product_dir,
             reverse=reverse,
+            max_workers=max_workers,
         )
 
     def get(
@@ -959,27 +1177,31 @@ class MaapClient:
         baseline: Optional[str] = None,
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
-        max_items: int = 50000,
+        max_items: Optional[int] = 50000,
         verbose: bool = False,
         format: Optional[str] = None,
         product_dir: bool = False,
         reverse: bool = False,
         frames: Optional[list[str]] = None,
         max_consecutive_failures: Optional[int] = None,
+        max_workers: int = 1,
     ) -> SyncResult:
         """
         Incremental sync: search + download + state tracking.
 
-        Loops day-by-day, calling search() for each day, then saving to
-        registry and downloading. This provides incremental progress and
-        state persistence.
+        Searches day-by-day in a background thread, registering each day's
+        URLs as they are found, while the main thread downloads the new URLs
+        of days already searched. STAC round-trips overlap with transfers,
+        and progress and state persist incrementally.
 
         Default time range: last 3 days if no start/end specified.
 
         Args:
             collection: Collection name
             product_type: Product type
-            baseline: Optional baseline filter (syncs all baselines if None)
+            baseline: Optional baseline filter (syncs all baselines if None:
+                     from the built catalog if one has this product, so
+                     rebuild it to pick up new baselines; else the queryables)
             start: Optional start datetime
             end: Optional end datetime (defaults to now)
             max_items: Maximum items to sync
@@ -988,6 +1210,7 @@ class MaapClient:
             frames: Optional frame letters to restrict the sync to (state is
                    per-URL, so filtered syncs are safe)
             max_consecutive_failures: Forwarded to batch_download; abort a baseline's batch after this many consecutive failures (None = never).
+            max_workers: Concurrent downloads within each day's batch (1 = serial)
 
         Raises:
             InvalidRequestError: If start > end or datetimes not timezone-aware
@@ -1011,7 +1234,12 @@ class MaapClient:
         if baseline:
             baselines = [baseline]
         else:
-            baselines = self.list_baselines(collection, product_type, from_built=False)
+            # The built catalog lists only baselines with data for this
+            # product; fall back to the collection's queryables without one
+            try:
+                baselines = self.list_baselines(collection, product_type, from_built=True)
+            except (FileNotFoundError, ValueError):
+                baselines = self.list_baselines(collection, product_type, from_built=False)
             if not baselines:
                 logger.warning(f"No baselines found for {collection}/{product_type}")
                 return SyncResult(
@@ -1027,73 +1255,142 @@ class MaapClient:
             baselines=baselines,
         )
 
+        # Same range for every baseline: format it once
+        start_zulu, end_zulu = to_zulu(start), to_zulu(end)
         for bl in baselines:
             logger.info(f"Syncing {collection}/{product_type}/{bl.upper()}...")
-            logger.info(f"  {to_zulu(start)}")
-            logger.info(f"  {to_zulu(end)}")
+            logger.info(f"  {start_zulu}")
+            logger.info(f"  {end_zulu}")
 
             try:
                 tracker = self.get_tracker(collection, product_type, bl)
                 result.tracker = tracker
 
-                # Search day-by-day, registering each day as it is found so
-                # a later failure never loses discovered URLs.
-                urls: list[str] = []
-                for day_urls in self.searcher.search_urls_iter_day(
-                    collection=collection,
-                    product_type=product_type,
-                    baseline=bl,
-                    start=start,
-                    end=end,
-                    verbose=verbose,
-                    format=format,
-                    reverse=reverse,
-                    frames=frames,
+                # Already downloaded, read before this run's downloads start.
+                # Scoped to the sync range so the read stays off registry
+                # files a concurrent same-product worker may be appending to.
+                done = {url for url, _ in tracker.load_downloads_with_paths(start, end)}
+
+                # Producer: search day-by-day, registering each day as it is
+                # found so a later failure never loses discovered URLs. It
+                # runs up to two days ahead of the downloads.
+                days: queue.Queue = queue.Queue(maxsize=2)
+                stop = threading.Event()
+                end_of_days = object()
+
+                def hand_over(item: object) -> bool:
+                    while not stop.is_set():
+                        try:
+                            days.put(item, timeout=0.5)
+                            return True
+                        except queue.Full:
+                            continue
+                    return False
+
+                def search_days() -> None:
+                    # Closing the day iterator cancels its queued searches
+                    try:
+                        with closing(self.searcher.search_urls_iter_day(
+                            collection=collection,
+                            product_type=product_type,
+                            baseline=bl,
+                            start=start,
+                            end=end,
+                            verbose=verbose,
+                            format=format,
+                            reverse=reverse,
+                            frames=frames,
+                        )) as day_iter:
+                            for day_urls in day_iter:
+                                # Checked every day, so a run of empty days
+                                # doesn't delay the consumer's shutdown
+                                if stop.is_set():
+                                    return
+                                if day_urls:
+                                    tracker.add_urls(day_urls)
+                                    if not hand_over(day_urls):
+                                        return
+                    finally:
+                        hand_over(end_of_days)
+
+                # Consumer: download each searched day's new URLs (in range
+                # and not yet downloaded, as the registry's pending set would
+                # give), up to max_items for the baseline
+                urls_found = 0
+                queued: set[str] = set()
+                remaining = max_items
+                downloaded_count = 0
+                failure_streak = 0
+                downloader = None
+                # Download records are appended in groups (see transaction())
+                with (
+                    tracker.transaction() as records,
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix="maap-sync-search") as search_pool,
                 ):
-                    if day_urls:
-                        tracker.add_urls(day_urls)
-                        urls.extend(day_urls)
+                    search_future = search_pool.submit(search_days)
+                    try:
+                        while (day_urls := days.get()) is not end_of_days:
+                            urls_found += len(day_urls)
+                            batch = list(islice(
+                                (
+                                    url for url in dict.fromkeys(filter_by_sensing_time(day_urls, start, end))
+                                    if url not in done and url not in queued
+                                ),
+                                remaining,
+                            ))
+                            if not batch:
+                                continue
+                            queued.update(batch)
+                            if remaining is not None:
+                                remaining -= len(batch)
+
+                            logger.info(f"Downloading {len(batch)} new of {len(day_urls)} found")
+                            if downloader is None:
+                                self._config.ensure_directories()
+                                downloader = self._get_downloader(
+                                    product_dir=product_dir, max_workers=max_workers
+                                )
+                            downloaded = downloader.batch_download(
+                                urls=batch,
+                                collection=collection,
+                                product_type=product_type,
+                                baseline=bl,
+                                skip_existing=True,
+                                on_download=records.mark_downloaded,
+                                verbose=verbose,
+                                max_consecutive_failures=max_consecutive_failures,
+                                prior_failures=failure_streak,
+                                max_workers=max_workers,
+                            )
+                            downloaded_count += len(downloaded)
+
+                            # batch_download's mapping includes successes and
+                            # skipped files; anything absent failed and must
+                            # reach the caller. Trailing failures carry over
+                            # into the next day's streak.
+                            for url in batch:
+                                if url in downloaded:
+                                    failure_streak = 0
+                                else:
+                                    failure_streak += 1
+                                    result.errors.append(f"{url}: download failed")
+                        search_future.result()  # Re-raise a failed search
+                    finally:
+                        stop.set()
+                        if downloader is not None:
+                            downloader.close()
 
                 for failed_day, err in self.searcher.last_failed_days:
                     result.failed_days.append((bl, failed_day, err))
 
-                result.urls_found += len(urls)
+                result.urls_found += urls_found
+                result.urls_downloaded += downloaded_count
 
-                # Filter to pending downloads. Scoped to the sync range: the
-                # result is identical (to_download intersects with this run's
-                # URLs, all inside the range) but the read stays off registry
-                # files a concurrent same-product worker may be appending to.
-                pending = tracker.get_pending_downloads(start, end)
-                to_download = [url for url in urls if url in pending][:max_items]
-
-                if not to_download:
+                if downloader is None:
                     logger.info(f"No new files to download for {bl.upper()}")
                     continue
 
-                logger.info(f"Found {len(urls)} URLs, {len(pending)} pending, downloading {len(to_download)}")
-
-                # Download with state tracking
-                self._config.ensure_directories()
-                downloader = self._get_downloader(product_dir=product_dir)
-                downloaded = downloader.batch_download(
-                    urls=to_download,
-                    collection=collection,
-                    product_type=product_type,
-                    baseline=bl,
-                    skip_existing=True,
-                    on_download=tracker.mark_downloaded,
-                    verbose=verbose,
-                    max_consecutive_failures=max_consecutive_failures,
-                )
-                result.urls_downloaded += len(downloaded)
-
-                # batch_download's mapping includes successes and skipped
-                # files; anything absent failed and must reach the caller.
-                for url in to_download:
-                    if url not in downloaded:
-                        result.errors.append(f"{url}: download failed")
-
-                logger.info(f"Downloaded {len(downloaded)} files for {bl.upper()}")
+                logger.info(f"Found {urls_found} URLs, downloaded {downloaded_count} files for {bl.upper()}")
             except (AuthenticationError, CredentialsError, BatchDownloadAborted):
                 # Auth failures doom every remaining baseline identically, and
                 # an abort was explicitly requested by the caller: propagate so
@@ -1145,11 +1442,12 @@ class MaapClient:
         products_filter = [product_type] if product_type else None
         baselines_filter = [baseline] if baseline else None
 
-        # Determine collections to build
+        # Determine collections to build (the configured list is local, no
+        # API call; the tuple is iterated as-is rather than copied)
         if collection:
-            collections = [collection]
+            collections: tuple[str, ...] = (collection,)
         else:
-            collections = self.list_collections()
+            collections = self._config.collections
             logger.info(f"Building catalogs for {len(collections)} collections...")
 
         results: dict[str, Path] = {}
@@ -1175,7 +1473,7 @@ class MaapClient:
                 # Summary
                 products = catalog.products
                 total_products = len(products)
-                total_baselines = sum(len(p.baselines) for p in products.values())
+                total_baselines = sum(map(len, map(attrgetter("baselines"), products.values())))
                 logger.info(f"Summary: {total_products} products, {total_baselines} baselines")
 
                 if failures_out is not None:
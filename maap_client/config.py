@@ -1,8 +1,9 @@
 """Configuration management for MAAP client."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+import functools
 import os
 
 from maap_client.constants import (
@@ -17,60 +18,91 @@ from maap_client.constants import (
     DEFAULT_BUILT_CATALOG_DIR,
     DEFAULT_REGISTRY_DIR,
     DEFAULT_CREDENTIALS_FILE,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_RANGE_PARTS,
+    DEFAULT_CHUNK_SIZE,
 )
 
 
-@dataclass
+def _expand_path(value: str) -> Path:
+    return Path(value).expanduser()
+
+
+@functools.lru_cache(maxsize=16)
+def _expanded_default(path: str, home: Optional[str]) -> Path:
+    return Path(path).expanduser()
+
+
+def _default_path(path: str) -> Callable[[], Path]:
+    """
+    default_factory for a ~ path: expanded once per home directory.
+
+    Paths are immutable, so every config shares one object. Keying on HOME
+    (rather than expanding at import) keeps a changed HOME effective.
+    """
+    return lambda: _expanded_default(path, os.environ.get("HOME"))
+
+
+# Environment overrides: (variable, MaapConfig attribute, conversion)
+_ENV_OVERRIDES: tuple[tuple[str, str, Callable[[str], object]], ...] = (
+    ("MAAP_DATA_DIR", "data_dir", _expand_path),
+    ("MAAP_CATALOG_DIR", "catalog_dir", _expand_path),
+    ("MAAP_BUILT_CATALOG_DIR", "built_catalog_dir", _expand_path),
+    ("MAAP_REGISTRY_DIR", "registry_dir", _expand_path),
+    ("MAAP_CREDENTIALS_FILE", "credentials_file", _expand_path),
+    ("MAAP_CATALOG_URL", "catalog_url", str),
+    ("MAAP_MISSION_START", "mission_start", str),
+    ("MAAP_MISSION_END", "mission_end", str),
+)
+
+
+@dataclass(slots=True)
 class MaapConfig:
-    """Central configuration for MAAP client."""
+    """Central configuration for MAAP client (slotted: no per-instance __dict__)."""
 
     # Directories
-    data_dir: Path = field(default_factory=lambda: Path(DEFAULT_DATA_DIR).expanduser())
-    catalog_dir: Path = field(default_factory=lambda: Path(DEFAULT_CATALOG_DIR).expanduser())
-    built_catalog_dir: Path = field(default_factory=lambda: Path(DEFAULT_BUILT_CATALOG_DIR).expanduser())
-    registry_dir: Path = field(default_factory=lambda: Path(DEFAULT_REGISTRY_DIR).expanduser())
+    data_dir: Path = field(default_factory=_default_path(DEFAULT_DATA_DIR))
+    catalog_dir: Path = field(default_factory=_default_path(DEFAULT_CATALOG_DIR))
+    built_catalog_dir: Path = field(default_factory=_default_path(DEFAULT_BUILT_CATALOG_DIR))
+    registry_dir: Path = field(default_factory=_default_path(DEFAULT_REGISTRY_DIR))
 
     # Credentials
-    credentials_file: Path = field(
-        default_factory=lambda: Path(DEFAULT_CREDENTIALS_FILE).expanduser()
-    )
+    credentials_file: Path = field(default_factory=_default_path(DEFAULT_CREDENTIALS_FILE))
 
     # API endpoints
     catalog_url: str = DEFAULT_CATALOG_URL
     token_url: str = DEFAULT_TOKEN_URL
 
+    # HTTP connection pool size for authenticated sessions
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+
+    # Parallel byte-range connections per large download (1 = off)
+    range_parts: int = DEFAULT_RANGE_PARTS
+
+    # Bytes per streamed download read/write
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+
     # Mission settings
     mission: str = DEFAULT_MISSION
     mission_start: str = DEFAULT_MISSION_START
     mission_end: str = DEFAULT_MISSION_END
 
-    # Known collections
-    collections: list[str] = field(default_factory=lambda: DEFAULT_COLLECTIONS.copy())
+    # Known collections (a tuple: shared safely, no defensive copies)
+    collections: tuple[str, ...] = tuple(DEFAULT_COLLECTIONS)
 
     @classmethod
     def from_env(cls) -> "MaapConfig":
         """Load configuration from environment variables."""
         config = cls()
-
-        if env_data := os.environ.get("MAAP_DATA_DIR"):
-            config.data_dir = Path(env_data).expanduser()
-        if env_catalog := os.environ.get("MAAP_CATALOG_DIR"):
-            config.catalog_dir = Path(env_catalog).expanduser()
-        if env_built_catalog := os.environ.get("MAAP_BUILT_CATALOG_DIR"):
-            config.built_catalog_dir = Path(env_built_catalog).expanduser()
-        if env_registry := os.environ.get("MAAP_REGISTRY_DIR"):
-            config.registry_dir = Path(env_registry).expanduser()
-        if env_creds := os.environ.get("MAAP_CREDENTIALS_FILE"):
-            config.credentials_file = Path(env_creds).expanduser()
-        if env_catalog_url := os.environ.get("MAAP_CATALOG_URL"):
-            config.catalog_url = env_catalog_url
-        if env_mission_start := os.environ.get("MAAP_MISSION_START"):
-            config.mission_start = env_mission_start
-        if env_mission_end := os.environ.get("MAAP_MISSION_END"):
-            config.mission_end = env_mission_end
-
+        config._apply_env()
         return config
 
+    def _apply_env(self) -> None:
+        """Override fields from the MAAP_* environment variables that are set."""
+        for var, attr, convert in _ENV_OVERRIDES:
+            if value := os.environ.get(var):
+                setattr(self, attr, convert(value))
+
     @classmethod
     def from_file(cls, config_path: Path) -> "MaapConfig":
         """Load configuration from TOML file."""
@@ -106,6 +138,12 @@ class MaapConfig:
                 config.catalog_url = catalog_url
             if token_url := api.get("token_url"):
                 config.token_url = token_url
+            if pool_maxsize := api.get("pool_maxsize"):
+                config.pool_maxsize = int(pool_maxsize)
+            if range_parts := api.get("range_parts"):
+                config.range_parts = int(range_parts)
+            if chunk_size := api.get("chunk_size"):
+                config.chunk_size = int(chunk_size)
 
         # Parse mission section
         if mission := data.get("mission"):
@@ -115,14 +153,12 @@ class MaapConfig:
                 config.mission_start = start
             if end := mission.get("end"):
                 config.mission_end = end
-            # collections: replace entire list
+            # collections: replace entire list (duplicates dropped, order kept)
             if collections := mission.get("collections"):
-                config.collections = list(collections)
+                config.collections = tuple(dict.fromkeys(collections))
             # collections_extend: add to existing list
             if collections_extend := mission.get("collections_extend"):
-                for c in collections_extend:
-                    if c not in config.collections:
-                        config.collections.append(c)
+                config.collections = tuple(dict.fromkeys((*config.collections, *collections_extend)))
 
         return config
 
@@ -134,34 +170,22 @@ class MaapConfig:
         2. Config file (if provided or default exists)
         3. Defaults
         """
-        # Start with defaults
-        config = cls()
-
         # Try to load from file
         if config_path is None:
             config_path = Path("~/.maap/config.toml").expanduser()
 
-        if config_path.exists():
-            config = cls.from_file(config_path)
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            # Start with defaults
+            config = cls()
+        else:
+            # Parsed once per file version; each caller gets its own copy
+            # (fields are immutable values, so a shallow one is enough)
+            config = replace(_from_file_cached(cls, str(config_path), mtime_ns))
 
         # Override with environment variables
-        env_config = cls.from_env()
-        if os.environ.get("MAAP_DATA_DIR"):
-            config.data_dir = env_config.data_dir
-        if os.environ.get("MAAP_CATALOG_DIR"):
-            config.catalog_dir = env_config.catalog_dir
-        if os.environ.get("MAAP_BUILT_CATALOG_DIR"):
-            config.built_catalog_dir = env_config.built_catalog_dir
-        if os.environ.get("MAAP_REGISTRY_DIR"):
-            config.registry_dir = env_config.registry_dir
-        if os.environ.get("MAAP_CREDENTIALS_FILE"):
-            config.credentials_file = env_config.credentials_file
-        if os.environ.get("MAAP_CATALOG_URL"):
-            config.catalog_url = env_config.catalog_url
-        if os.environ.get("MAAP_MISSION_START"):
-            config.mission_start = env_config.mission_start
-        if os.environ.get("MAAP_MISSION_END"):
-            config.mission_end = env_config.mission_end
+        config._apply_env()
 
         return config
 
@@ -174,3 +198,9 @@ class MaapConfig:
 
         # Ensure credentials directory exists
         self.credentials_file.parent.mkdir(parents=True, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _from_file_cached(cls: type[MaapConfig], path: str, mtime_ns: int) -> MaapConfig:
+    """Parse a config file, keyed by its mtime so edits are picked up."""
+    return cls.from_file(Path(path))
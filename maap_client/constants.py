@@ -52,9 +52,33 @@ DEDUP_PRODUCTS = {"AUX_MET_1D"}
 NO_ORBIT_PRODUCTS = {"AUX_MET_1D"}
 
 # Download settings
-DEFAULT_CHUNK_SIZE = 8192
+# Bytes per streamed read/write: large enough that per-chunk Python overhead
+# and write() syscalls stay negligible on fast links
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 DEFAULT_TIMEOUT = 30
 
+# Streamed bytes between flushing a download to disk and dropping it from
+# the page cache (dirty pages can't be evicted until written back)
+PAGE_CACHE_DROP_BYTES = 64 * 1024 * 1024
+
+# Parallel byte-range downloads: connections per file (1 = single stream),
+# only used for files of at least DEFAULT_RANGE_MIN_SIZE bytes
+DEFAULT_RANGE_PARTS = 1
+DEFAULT_RANGE_MIN_SIZE = 64 * 1024 * 1024
+
+# HTTP connection pooling for authenticated sessions (connections kept per host)
+DEFAULT_POOL_MAXSIZE = 20
+
+# Files fetched concurrently by `maap download` (each worker streams one file)
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+# Collections whose queryables are fetched concurrently by catalog update
+DEFAULT_QUERYABLES_WORKERS = 8
+
+# Products processed concurrently by catalog build (STAC requests overlap;
+# keep below the STAC adapter's pool size of 10)
+DEFAULT_BUILD_WORKERS = 8
+
 # STAC transport retries (transient gateway errors: nginx 502/503/504).
 # Backoff factor 2 -> sleeps of 0, 4, 8, 16, 32 s across 5 retries
 # (urllib3 skips the backoff before the first retry).
@@ -64,6 +88,9 @@ STAC_RETRY_BACKOFF_FACTOR = 2
 STAC_RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
 STAC_RETRY_ALLOWED_METHODS = ("GET", "POST")
 
+# Day searches kept in flight by search_urls_iter_day (results still yield in day order)
+DEFAULT_SEARCH_PREFETCH = 4
+
 # Scope, deliberate: these apply to STAC search only. Downloads get one
 # attempt per file (plus the 401/403 token refresh in download.py) and no
 # transient retry loop — retry cadence lives in the wrapper
@@ -1,20 +1,31 @@
 """Authenticated file downloads from MAAP."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 from typing import Callable, Optional
-from urllib.parse import urlparse
 import logging
 import os
+import threading
 import time
 import requests
-
-from maap_client.auth import TokenManager, get_auth_headers
-from maap_client.constants import DEFAULT_CHUNK_SIZE, DEFAULT_MISSION, DEDUP_PRODUCTS
+from requests.adapters import HTTPAdapter
+
+from maap_client.auth import BearerAuth, TokenManager, authenticated_session
+from maap_client.constants import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MISSION,
+    DEFAULT_RANGE_MIN_SIZE,
+    DEFAULT_RANGE_PARTS,
+    DEDUP_PRODUCTS,
+    PAGE_CACHE_DROP_BYTES,
+)
 from maap_client.exceptions import BatchDownloadAborted, DownloadError
 from maap_client.paths import (
     extract_orbit_frame,
     extract_sensing_time,
-    generate_data_path,
+    generate_data_dir,
+    url_filename,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,6 +34,57 @@ logger = logging.getLogger(__name__)
 ProgressCallback = Callable[[int, int], None]
 
 
+class _RangeNotHonored(Exception):
+    """Server answered a Range request with the whole file."""
+
+
+class _DownloadCancelled(Exception):
+    """Raised inside a batch worker's download once the batch is aborted."""
+
+
+def _list_names(directory: Path) -> frozenset[str]:
+    """Entry names in a directory (empty if it doesn't exist yet)."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+
+def _hint_sequential(fd: int) -> None:
+    """
+    Hint the kernel that a new download file is written front to back.
+
+    POSIX_FADV_SEQUENTIAL tunes writeback for one stream. Best effort:
+    skipped where unavailable (macOS, Windows) or rejected. The size is
+    not preallocated: without native fallocate (NFS v3, many FUSE mounts)
+    posix_fallocate writes zeros, doubling the I/O.
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _drop_page_cache(fd: int) -> None:
+    """
+    Tell the kernel the written part of a file won't be read back soon.
+
+    POSIX_FADV_DONTNEED only evicts clean pages, so the data is first
+    written back with fdatasync(); a bulk sync then doesn't fill the page
+    cache with multi-GB products at the expense of other data. Call it
+    periodically while writing to keep the dirty backlog bounded. No-op
+    where posix_fadvise is unavailable (macOS, Windows).
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass  # Only a hint; some filesystems reject it
+
+
 class DownloadManager:
     """Handles authenticated file downloads from MAAP."""
 
@@ -33,6 +95,9 @@ class DownloadManager:
         mission: str = DEFAULT_MISSION,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         product_dir: bool = False,
+        range_parts: int = DEFAULT_RANGE_PARTS,
+        session: Optional[requests.Session] = None,
+        max_workers: int = 1,
     ):
         """
         Initialize download manager.
@@ -43,12 +108,48 @@ class DownloadManager:
             mission: Mission name for path generation
             chunk_size: Download chunk size in bytes
             product_dir: If True, wrap each file in a subdirectory named after the file stem
+            range_parts: Fetch files of at least DEFAULT_RANGE_MIN_SIZE bytes as this
+                many parallel byte ranges when the server supports it (1 = off)
+            session: Session to download with (default: the token manager's
+                shared pooled session, so files reuse warm connections; a
+                dedicated one when max_workers * range_parts connections
+                would not fit its pool). A caller's session must authenticate
+                its own requests, e.g. with auth.BearerAuth
+            max_workers: Default number of concurrent downloads in batch_download
         """
         self._token_manager = token_manager
         self._data_dir = data_dir
         self._mission = mission
         self._chunk_size = chunk_size
         self._product_dir = product_dir
+        # Ranged writes need positioned I/O (os.pwrite is POSIX-only)
+        self._range_parts = range_parts if hasattr(os, "pwrite") else 1
+        self._max_workers = max_workers
+
+        # A pool smaller than the number of concurrent connections discards
+        # the surplus when they finish, and the next file pays a new TLS
+        # handshake. The session is owned (and closed) here only if made here.
+        self._own_session: Optional[requests.Session] = None
+        connections = max_workers * self._range_parts
+        if session is None and connections > token_manager.pool_maxsize:
+            session = self._own_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=connections)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.auth = BearerAuth(token_manager)
+        self._session = session if session is not None else authenticated_session(token_manager)
+
+    def close(self) -> None:
+        """Close the download session if this manager created it."""
+        if self._own_session is not None:
+            self._own_session.close()
+            self._own_session = None
+
+    def __enter__(self) -> "DownloadManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def download_file(
         self,
@@ -71,38 +172,58 @@ class DownloadManager:
             DownloadError: If download fails or size verification fails
         """
         if output_path is None:
-            # Extract filename from URL
-            parsed = urlparse(url)
-            filename = os.path.basename(parsed.path)
-            output_path = self._data_dir / filename
+            output_path = self._data_dir / url_filename(url)
 
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         part_path = output_path.with_name(output_path.name + ".part")
 
-        logger.info(f"Downloading: {url}")
+        logger.debug(f"Downloading: {url}")
         logger.debug(f"  -> {output_path}")
 
+        # The session's BearerAuth sets the token at dispatch time
         for attempt in (1, 2):
-            headers = get_auth_headers(self._token_manager)
+            sent_token = None
             try:
                 try:
                     t0 = time.monotonic()
-                    with requests.get(url, headers=headers, stream=True, timeout=60) as r:
-                        r.raise_for_status()
-
-                        # Get total size if available
-                        total_size = int(r.headers.get("content-length", 0))
-                        downloaded = 0
-
-                        # "wb" truncates any stale .part left by a previous crash
-                        with open(part_path, "wb") as f:
-                            for chunk in r.iter_content(chunk_size=self._chunk_size):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-
-                                if progress_callback and total_size:
-                                    progress_callback(downloaded, total_size)
+                    ranged_size = None
+                    if self._range_parts > 1:
+                        try:
+                            ranged_size = self._download_ranged(
+                                url, part_path, progress_callback
+                            )
+                        except _RangeNotHonored:
+                            logger.debug(f"  Range requests not honored, streaming: {url}")
+
+                    if ranged_size is not None:
+                        total_size = downloaded = ranged_size
+                    else:
+                        with self._session.get(url, stream=True, timeout=60) as r:
+                            r.raise_for_status()
+
+                            # Get total size if available
+                            total_size = int(r.headers.get("content-length", 0))
+                            downloaded = 0
+
+                            # O_TRUNC discards any stale .part left by a previous crash
+                            fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                            with os.fdopen(fd, "wb") as f:
+                                _hint_sequential(fd)
+                                next_drop = PAGE_CACHE_DROP_BYTES
+                                for chunk in r.iter_content(chunk_size=self._chunk_size):
+                                    f.write(chunk)
+                                    downloaded += len(chunk)
+                                    if downloaded >= next_drop:
+                                        f.flush()
+                                        _drop_page_cache(fd)
+                                        next_drop = downloaded + PAGE_CACHE_DROP_BYTES
+
+                                    if progress_callback and total_size:
+                                        progress_callback(downloaded, total_size)
+
+                                f.flush()
+                                _drop_page_cache(f.fileno())
 
                     elapsed = time.monotonic() - t0
 
@@ -112,6 +233,11 @@ class DownloadManager:
                         )
 
                 except requests.HTTPError as e:
+                    # Invalidate the token that was actually sent: another
+                    # thread may have refreshed it since
+                    request = getattr(e.response, "request", None)
+                    if request is not None:
+                        sent_token = request.headers.get("Authorization", "").removeprefix("Bearer ") or None
                     raise DownloadError(url, str(e), e.response.status_code if e.response is not None else None)
                 except requests.RequestException as e:
                     raise DownloadError(url, str(e))
@@ -121,7 +247,7 @@ class DownloadManager:
                     logger.warning(
                         f"HTTP {e.status_code}, refreshing token and retrying once: {url}"
                     )
-                    self._token_manager.invalidate()
+                    self._token_manager.invalidate(sent_token)
                     continue
                 raise
             except BaseException:
@@ -140,11 +266,79 @@ class DownloadManager:
         if elapsed > 0 and downloaded > 0:
             rate_mbps = (downloaded / (1024 * 1024)) / elapsed
             size_mb = downloaded / (1024 * 1024)
-            logger.info(f"Download complete: {output_path} ({size_mb:.1f} MB, {rate_mbps:.1f} MB/s, {elapsed:.1f} s)")
+            logger.debug(f"Download complete: {output_path} ({size_mb:.1f} MB, {rate_mbps:.1f} MB/s, {elapsed:.1f} s)")
         else:
-            logger.info(f"Download complete: {output_path}")
+            logger.debug(f"Download complete: {output_path}")
         return output_path
 
+    def _download_ranged(
+        self,
+        url: str,
+        part_path: Path,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Optional[int]:
+        """
+        Download a file as parallel byte ranges written in place.
+
+        Each range is streamed on its own connection and written at its
+        offset with os.pwrite, so nothing is buffered beyond one chunk.
+
+        Returns:
+            File size, or None (nothing written) when the server does not
+            advertise byte ranges or the file is below DEFAULT_RANGE_MIN_SIZE
+
+        Raises:
+            _RangeNotHonored: If a range request returned the whole file
+            requests.RequestException, DownloadError: As for a single stream
+        """
+        # Ranges index the stored bytes, so ask for no transfer encoding
+        headers = {"Accept-Encoding": "identity"}
+        with self._session.head(url, headers=headers, allow_redirects=True, timeout=60) as r:
+            r.raise_for_status()
+            accepts_ranges = r.headers.get("accept-ranges", "").lower() == "bytes"
+            total_size = int(r.headers.get("content-length", 0))
+        if not accepts_ranges or total_size < DEFAULT_RANGE_MIN_SIZE:
+            return None
+
+        step = -(-total_size // self._range_parts)  # ceil division
+        ranges = [(first, min(first + step, total_size) - 1) for first in range(0, total_size, step)]
+        progress_lock = threading.Lock()
+        downloaded = 0
+
+        def fetch_range(fd: int, first: int, last: int) -> None:
+            nonlocal downloaded
+            range_headers = {**headers, "Range": f"bytes={first}-{last}"}
+            with self._session.get(url, headers=range_headers, stream=True, timeout=60) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise _RangeNotHonored(url)
+                offset = first
+                for chunk in r.iter_content(chunk_size=self._chunk_size):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    if progress_callback:
+                        with progress_lock:
+                            downloaded += len(chunk)
+                            progress_callback(downloaded, total_size)
+            if offset != last + 1:
+                raise DownloadError(
+                    url, f"incomplete range {first}-{last}: {offset - first}/{last - first + 1} bytes"
+                )
+
+        logger.debug(f"  {len(ranges)} byte ranges of {total_size} bytes")
+        # O_TRUNC discards any stale .part left by a previous crash
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            os.ftruncate(fd, total_size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(fetch_range, fd, first, last) for first, last in ranges]
+                for future in futures:
+                    future.result()
+            _drop_page_cache(fd)
+        finally:
+            os.close(fd)
+        return total_size
+
     def batch_download(
         self,
         urls: list[str],
@@ -155,10 +349,16 @@ class DownloadManager:
         on_download: Optional[Callable[[str, Path], None]] = None,
         verbose: bool = False,
         max_consecutive_failures: Optional[int] = None,
+        prior_failures: int = 0,
+        max_workers: Optional[int] = None,
     ) -> dict[str, Path]:
         """
         Download multiple files.
 
+        Files download on up to max_workers threads. Results, on_download
+        callbacks and the consecutive-failure count are still handled on the
+        calling thread in URL order, so state updates stay single-threaded.
+
         Args:
             urls: List of product URLs
             collection: Collection name
@@ -169,92 +369,168 @@ class DownloadManager:
                          with (url, local_path). Used for incremental state updates.
             verbose: Print progress messages
             max_consecutive_failures: Abort with BatchDownloadAborted after this many consecutive DownloadErrors (None = never abort, current behavior).
+            prior_failures: Consecutive failures carried over from a previous call,
+                for callers downloading one logical batch in chunks
+            max_workers: Concurrent downloads (default: the manager's max_workers)
 
         Returns:
             Dictionary mapping URL to local path (only successful downloads)
         """
         results = {}
-        consecutive_failures = 0
+        consecutive_failures = prior_failures
         total = len(urls)
         width = len(str(total))
+        workers = max(1, max_workers if max_workers is not None else self._max_workers)
+
+        # Set on abort or interrupt: in-flight downloads stop at their next
+        # chunk and remove their .part files
+        cancelled = threading.Event()
+
+        def stop_if_cancelled(downloaded: int, total_size: int) -> None:
+            if cancelled.is_set():
+                raise _DownloadCancelled()
+
+        # Each entry is (i, url, filename, Path of an existing file or Future)
+        planned: list[tuple[int, str, str, Path | Future]] = []
+        # A second URL for a target or granule queued in this batch waits for
+        # the serial pass below, where the first one is already on disk
+        deferred: list[str] = []
+        queued_paths: set[Path] = set()
+        queued_granules: set[tuple[Path, str, Optional[str]]] = set()
+
+        # Per-file lines are debug-level (formatted only when enabled); INFO
+        # gets a counter about every 5% of the batch instead
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Files of a batch share everything in their path up to the day, so
+        # each day directory is built once (same layout as generate_data_path).
+        # With skip_existing it is also listed once, so the check below is a
+        # set lookup instead of a stat() per URL.
+        day_dirs: dict[date, tuple[Path, frozenset[str]]] = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for i, url in enumerate(urls, 1):
+                    if debug:
+                        logger.debug(f"[{i:>{width}}/{total}] Processing: {url}")
+
+                    # Determine output path
+                    filename = url_filename(url)
+                    dt = extract_sensing_time(filename)
+
+                    if dt is None:
+                        logger.warning("  Skipping - cannot extract datetime from filename")
+                        continue
+
+                    day = dt.date()
+                    if (cached := day_dirs.get(day)) is None:
+                        day_dir = generate_data_dir(
+                            self._data_dir, self._mission, collection, product_type, baseline, dt
+                        )
+                        cached = day_dirs[day] = (day_dir, _list_names(day_dir) if skip_existing else frozenset())
+                    day_dir, day_names = cached
+                    if self._product_dir:
+                        stem = Path(filename).stem
+                        output_path = day_dir / stem / filename
+                        # Only a listed product directory can hold the file
+                        exists = stem in day_names and output_path.exists()
+                    else:
+                        output_path = day_dir / filename
+                        exists = filename in day_names
+                    if output_path in queued_paths:
+                        deferred.append(url)
+                        continue
+
+                    # Skip if exact file exists
+                    if skip_existing and exists:
+                        if debug:
+                            logger.debug(f"  Skipping - already exists: {output_path}")
+                        if verbose:
+                            logger.info(f"[{i:>{width}}/{total}] Already exists: {filename}")
+                        planned.append((i, url, filename, output_path))
+                        continue
+
+                    # For DEDUP_PRODUCTS, skip if a different version of this granule
+                    # already exists (same sensing_time + orbit_frame, different stem).
+                    # Checks any extension so h5 and hdr stay on the same version.
+                    if skip_existing and product_type in DEDUP_PRODUCTS:
+                        orbit_frame = extract_orbit_frame(filename)
+                        sensing_str = dt.strftime("%Y%m%dT%H%M%SZ")
+                        granule = (day_dir, sensing_str, orbit_frame)
+                        if granule in queued_granules:
+                            deferred.append(url)
+                            continue
+                        pattern = f"*_{sensing_str}_*_{orbit_frame}.*" if orbit_frame else f"*_{sensing_str}_*.*"
+                        our_stem = Path(filename).stem
+                        other_version = [
+                            f for f in day_dir.rglob(pattern)
+                            if f.stem != our_stem and f.suffix != ".part"
+                        ]
+                        if other_version:
+                            logger.debug(f"  Skipping - duplicate granule exists: {other_version[0].stem}")
+                            if verbose:
+                                logger.info(f"[{i:>{width}}/{total}] Duplicate exists: {other_version[0].stem}")
+                            planned.append((i, url, filename, other_version[0]))
+                            continue
+                        queued_granules.add(granule)
 
-        for i, url in enumerate(urls, 1):
-            logger.info(f"[{i:>{width}}/{total}] Processing: {url}")
-
-            # Determine output path
-            parsed = urlparse(url)
-            filename = os.path.basename(parsed.path)
-            dt = extract_sensing_time(filename)
-
-            if dt is None:
-                logger.warning("  Skipping - cannot extract datetime from filename")
-                continue
-
-            output_path = generate_data_path(
-                data_dir=self._data_dir,
-                mission=self._mission,
-                collection=collection,
-                product_type=product_type,
-                baseline=baseline,
-                dt=dt,
-                filename=filename,
-                product_dir=self._product_dir,
-            )
-
-            # Skip if exact file exists
-            if skip_existing and output_path.exists():
-                logger.info(f"  Skipping - already exists: {output_path}")
-                if verbose:
-                    logger.info(f"[{i:>{width}}/{total}] Already exists: {filename}")
-                results[url] = output_path
-                # Still call callback for existing files (state tracking)
-                if on_download:
-                    on_download(url, output_path)
-                continue
-
-            # For DEDUP_PRODUCTS, skip if a different version of this granule
-            # already exists (same sensing_time + orbit_frame, different stem).
-            # Checks any extension so h5 and hdr stay on the same version.
-            if skip_existing and product_type in DEDUP_PRODUCTS:
-                orbit_frame = extract_orbit_frame(filename)
-                sensing_str = dt.strftime("%Y%m%dT%H%M%SZ")
-                pattern = f"*_{sensing_str}_*_{orbit_frame}.*" if orbit_frame else f"*_{sensing_str}_*.*"
-                date_dir = output_path.parent.parent if self._product_dir else output_path.parent
-                our_stem = Path(filename).stem
-                other_version = [
-                    f for f in date_dir.rglob(pattern)
-                    if f.stem != our_stem and f.suffix != ".part"
-                ]
-                if other_version:
-                    logger.info(f"  Skipping - duplicate granule exists: {other_version[0].stem}")
                     if verbose:
-                        logger.info(f"[{i:>{width}}/{total}] Duplicate exists: {other_version[0].stem}")
-                    results[url] = other_version[0]
-                    if on_download:
-                        on_download(url, other_version[0])
-                    continue
-
-            if verbose:
-                logger.info(f"[{i:>{width}}/{total}] Downloading: {filename}")
+                        logger.info(f"[{i:>{width}}/{total}] Downloading: {filename}")
+
+                    queued_paths.add(output_path)
+                    future = executor.submit(self.download_file, url, output_path, stop_if_cancelled)
+                    planned.append((i, url, filename, future))
+
+                total_planned = len(planned)
+                progress_every = max(1, total_planned // 20)
+                planned_width = len(str(total_planned))
+                for done, (i, url, filename, outcome) in enumerate(planned, 1):
+                    if isinstance(outcome, Path):
+                        results[url] = outcome
+                        # Still call callback for existing files (state tracking)
+                        if on_download:
+                            on_download(url, outcome)
+                    else:
+                        try:
+                            path = outcome.result()
+                            results[url] = path
+                            # Call callback after successful download
+                            if on_download:
+                                on_download(url, path)
+                            consecutive_failures = 0
+                        except DownloadError as e:
+                            consecutive_failures += 1
+                            logger.error(f"  Download failed: {e}")
+                            if verbose:
+                                logger.error(f"[{i:>{width}}/{total}] Error: {e}")
+                            if (
+                                max_consecutive_failures is not None
+                                and consecutive_failures >= max_consecutive_failures
+                            ):
+                                raise BatchDownloadAborted(len(results), consecutive_failures, e)
+
+                    if done % progress_every == 0 or done == total_planned:
+                        logger.info(f"[{done:>{planned_width}}/{total_planned}] files processed")
+            except BaseException:
+                cancelled.set()
+                executor.shutdown(cancel_futures=True)
+                raise
 
-            try:
-                path = self.download_file(url, output_path)
-                results[url] = path
-                # Call callback after successful download
-                if on_download:
-                    on_download(url, path)
-                consecutive_failures = 0
-            except DownloadError as e:
-                consecutive_failures += 1
-                logger.error(f"  Download failed: {e}")
-                if verbose:
-                    logger.error(f"[{i:>{width}}/{total}] Error: {e}")
-                if (
-                    max_consecutive_failures is not None
-                    and consecutive_failures >= max_consecutive_failures
-                ):
-                    raise BatchDownloadAborted(len(results), consecutive_failures, e)
-                continue
+        if deferred:
+            results.update(
+                self.batch_download(
+                    urls=deferred,
+                    collection=collection,
+                    product_type=product_type,
+                    baseline=baseline,
+                    skip_existing=skip_existing,
+                    on_download=on_download,
+                    verbose=verbose,
+                    max_consecutive_failures=max_consecutive_failures,
+                    prior_failures=consecutive_failures,
+                    max_workers=1,
+                )
+            )
 
         return results
 
@@ -30,8 +30,14 @@ class DownloadError(MaapError):
 
     def __init__(self, url: str, message: str, status_code: int | None = None):
         self.url = url
+        self.message = message
         self.status_code = status_code
-        super().__init__(f"Download failed for {url}: {message}")
+        # Raw fields as args (so the error also pickles); the text is only
+        # built when the error is actually displayed
+        super().__init__(url, message, status_code)
+
+    def __str__(self) -> str:
+        return f"Download failed for {self.url}: {self.message}"
 
 
 class InvalidRequestError(MaapError):
@@ -14,6 +14,18 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Product/baseline patterns, compiled once: these run per URL on every
+# search, registry save and download
+_ECA_BASELINE_RE = re.compile(r"^ECA_[A-Z]{2}([A-Z]{2})_")
+_AEOLUS_BASELINE_RE = re.compile(r"/ALD_[UC]_N_\d[AB]/([A-Za-z0-9]{4})/\d{4}/", re.IGNORECASE)
+_ECA_PRODUCT_RE = re.compile(r"^ECA_[A-Z]{4}_(.+?)_\d{8}T\d{6}Z_")
+_AEOLUS_PRODUCT_MS_RE = re.compile(r"^AE_[A-Z]{4}_(ALD_[UC]_N_\d[AB])_\d{8}T\d{9}_")
+_AEOLUS_PRODUCT_RE = re.compile(r"^AE_[A-Z]{4}_(ALD_[UC]_N_\d[AB])_\d{8}T\d{6}_")
+# Both EarthCARE fields in one match (the two patterns above, combined)
+_ECA_PRODUCT_BASELINE_RE = re.compile(
+    r"^ECA_[A-Z]{2}(?P<baseline>[A-Z]{2})_(?P<product>.+?)_\d{8}T\d{6}Z_"
+)
+
 
 def generate_data_path(
     data_dir: Path,
@@ -44,13 +56,29 @@ def generate_data_path(
     Returns:
         Full path for the file
     """
-    base = data_dir / mission / collection / product_type / baseline / f"{dt.year:04d}" / f"{dt.month:02d}" / f"{dt.day:02d}"
+    base = generate_data_dir(data_dir, mission, collection, product_type, baseline, dt)
     if product_dir:
         stem = Path(filename).stem
         return base / stem / filename
     return base / filename
 
 
+def generate_data_dir(
+    data_dir: Path,
+    mission: str,
+    collection: str,
+    product_type: str,
+    baseline: str,
+    dt: datetime,
+) -> Path:
+    """
+    Generate the day directory that generate_data_path puts files in.
+
+    Structure: data_dir/mission/collection/product_type/baseline/yyyy/mm/dd
+    """
+    return data_dir / mission / collection / product_type / baseline / f"{dt.year:04d}" / f"{dt.month:02d}" / f"{dt.day:02d}"
+
+
 def generate_registry_path(
     registry_dir: Path,
     prefix: str,
@@ -78,6 +106,16 @@ def generate_registry_path(
     return registry_dir / prefix / mission / collection / product_type / baseline
 
 
+def url_filename(url: str) -> str:
+    """
+    Get the filename from a product URL (last path segment).
+
+    Same result as os.path.basename(urlparse(url).path) for product URLs,
+    with plain string splits instead of a full URL parse.
+    """
+    return url.partition("#")[0].partition("?")[0].rpartition("/")[2]
+
+
 def extract_sensing_time(filename: str) -> Optional[datetime]:
     """
     Extract sensing time (first timestamp) from product filename.
@@ -345,7 +383,7 @@ def extract_baseline(uri: str) -> Optional[str]:
     filename = os.path.basename(uri)
 
     # EarthCARE: baseline in filename (ECA_XX + baseline)
-    match = re.match(r"^ECA_[A-Z]{2}([A-Z]{2})_", filename)
+    match = _ECA_BASELINE_RE.match(filename)
     if match:
         return match.group(1)
 
@@ -361,7 +399,7 @@ def extract_baseline(uri: str) -> Optional[str]:
         #       have a names like: AE_OPER_AUX_DCMZ1B_20230430T222914_20230430T223214_0001.EEF
         #       or:                AE_OPER_AUX_RBC_L2_20230220T025338_20230220T171326_0001.DBL
         #
-        match = re.search(r"/ALD_[UC]_N_\d[AB]/([A-Za-z0-9]{4})/\d{4}/", uri, re.IGNORECASE)
+        match = _AEOLUS_BASELINE_RE.search(uri)
         if match:
             return match.group(1)
 
@@ -391,7 +429,7 @@ def extract_product(filename: str) -> Optional[str]:
     filename = os.path.basename(filename)
 
     # EarthCARE: ECA_XXXX_ followed by product, then _YYYYMMDDTHHMMSSZ
-    match = re.match(r"^ECA_[A-Z]{4}_(.+?)_\d{8}T\d{6}Z_", filename)
+    match = _ECA_PRODUCT_RE.match(filename)
     if match:
         return match.group(1)
 
@@ -400,19 +438,38 @@ def extract_product(filename: str) -> Optional[str]:
     #
     # note: see the remark for Aeolus AUX file types in extract_baseline() above
     #
-    match = re.match(r"^AE_[A-Z]{4}_(ALD_[UC]_N_\d[AB])_\d{8}T\d{9}_", filename)
+    match = _AEOLUS_PRODUCT_MS_RE.match(filename)
     if match:
         return match.group(1)
 
     # this is needed for products without milliseconds in their sensing start datetime group
     # AE_OPER_ALD_U_N_2B_20230401T235022_20230402T012120_0002.DBL
-    match = re.match(r"^AE_[A-Z]{4}_(ALD_[UC]_N_\d[AB])_\d{8}T\d{6}_", filename)
+    match = _AEOLUS_PRODUCT_RE.match(filename)
     if match:
         return match.group(1)
 
     return None
 
 
+def extract_product_baseline(uri: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    Extract (product, baseline) from a product URL in one call.
+
+    Equivalent to (extract_product(uri), extract_baseline(uri)), but
+    EarthCARE names resolve both with a single regex match.
+
+    Args:
+        uri: Product URL or filename (Aeolus baselines need the URL path)
+
+    Returns:
+        Tuple of (product, baseline), either None if not found
+    """
+    match = _ECA_PRODUCT_BASELINE_RE.match(uri.rpartition("/")[2])
+    if match:
+        return match.group("product"), match.group("baseline")
+    return extract_product(uri), extract_baseline(uri)
+
+
 def extract_mission(filename: str) -> Optional[str]:
     """
     Extract mission identifier from filename.
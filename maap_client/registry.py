@@ -4,7 +4,7 @@ import os
 import re
 from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from maap_client.paths import (
     filter_by_sensing_time,
@@ -14,6 +14,24 @@ from maap_client.paths import (
 )
 
 
+def iter_pairs_file(file_path: Path) -> Iterator[tuple[str, str]]:
+    """
+    Yield (first, second) tuples from a file, one line at a time.
+
+    Same format as read_pairs_file(); a missing file yields nothing.
+    """
+    if not file_path.exists():
+        return
+
+    with open(file_path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            first, _, second = line.partition("|")
+            yield first, second
+
+
 def read_pairs_file(file_path: Path) -> list[tuple[str, str]]:
     """
     Read file and return list of (first, second) tuples.
@@ -25,20 +43,7 @@ def read_pairs_file(file_path: Path) -> list[tuple[str, str]]:
     - Single value: returns (value, "")
     - Ignores blank lines and comments (#)
     """
-    if not file_path.exists():
-        return []
-
-    results = []
-    with open(file_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split("|", 1)
-            first = parts[0]
-            second = parts[1] if len(parts) > 1 else ""
-            results.append((first, second))
-    return results
+    return list(iter_pairs_file(file_path))
 
 
 class Registry:
@@ -252,6 +257,15 @@ class Registry:
         with open(file_path, "a") as f:
             f.write(line + "\n")
 
+    @staticmethod
+    def append_lines(file_path: Path, lines: list[str]) -> None:
+        """Append several lines to a file with a single write."""
+        if not lines:
+            return
+        Registry.ensure_dir(file_path)
+        with open(file_path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+
     # --- Listing ---
 
     def list_url_files(self) -> list[Path]:
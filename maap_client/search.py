@@ -36,6 +36,8 @@ Assumptions:
 
 import logging
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Callable, Iterator, Literal, Optional
 
@@ -47,6 +49,7 @@ from maap_client.constants import (
     DEFAULT_CATALOG_URL,
     DEFAULT_MISSION_START,
     DEFAULT_MISSION_END,
+    DEFAULT_SEARCH_PREFETCH,
     NO_ORBIT_PRODUCTS,
     STAC_RETRY_ALLOWED_METHODS,
     STAC_RETRY_BACKOFF_FACTOR,
@@ -62,7 +65,12 @@ from maap_client.paths import (
     sort_by_sensing_time,
 )
 from maap_client.types import GranuleInfo
-from maap_client.utils import format_time_range, normalize_time_range, parse_datetime, to_stac_datetime
+from maap_client.utils import (
+    format_time_range,
+    normalize_time_range,
+    parse_mission_range,
+    to_stac_datetime,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -181,8 +189,7 @@ class MaapSearcher:
         Returns:
             Tuple of (clamped_start, clamped_end)
         """
-        mission_start = parse_datetime(self._mission_start)
-        mission_end = parse_datetime(self._mission_end)
+        mission_start, mission_end = parse_mission_range(self._mission_start, self._mission_end)
         return normalize_time_range(start, end, mission_start, mission_end)
 
     @staticmethod
@@ -624,6 +631,7 @@ class MaapSearcher:
         format: Optional[str] = None,
         reverse: bool = False,
         frames: Optional[list[str]] = None,
+        prefetch: int = DEFAULT_SEARCH_PREFETCH,
     ) -> Iterator[list[str]]:
         """
         Generator that searches day-by-day over a time range.
@@ -636,6 +644,8 @@ class MaapSearcher:
         Args:
             reverse: If True, iterate days from end to start (newest first).
             frames: Optional frame letters to restrict to (e.g. ['C', 'D']).
+            prefetch: Day searches kept in flight ahead of the consumer, so
+                round-trips overlap; days still yield in order (1 = serial)
 
         Yields:
             List of URLs for each day in the range
@@ -648,46 +658,63 @@ class MaapSearcher:
         day_ranges = list(self._iter_day_ranges(start, end))
         if reverse:
             day_ranges.reverse()
-        for i, (day_start, day_end) in enumerate(day_ranges):
-            datetime_arg = to_stac_datetime(day_start, day_end)
-            filter_str = self._build_filter(product_type, baseline=baseline, frames=frames)
-            try:
-                search = self.client.search(
-                    collections=[collection],
-                    filter=filter_str,
-                    filter_lang="cql2-text",
-                    datetime=datetime_arg,
-                    method="GET",
-                    max_items=max_items,
-                )
-                urls = self._clean_search_results(search, day_start, day_end, format=format)
-            except (AuthenticationError, CredentialsError):
-                raise
-            except Exception as e:
-                # Transport retries are exhausted: skip the day, keep the range.
-                logger.warning(f"FAILED DAY {day_start.date().isoformat()}: {e}")
-                failed_ranges.append((day_start, day_end))
-                self.last_failed_days.append((day_start.date(), str(e)))
-                continue
+        filter_str = self._build_filter(product_type, baseline=baseline, frames=frames)
+        client = self.client  # Lazy init stays on this thread
 
-            if verbose:
-                # Show baselines found by extracting from results
-                if baseline:
-                    bl_str = f"({baseline.upper()})"
-                elif urls:
-                    baselines_found = sorted(set(
-                        extract_baseline(os.path.basename(url)) or "?"
-                        for url in urls
-                    ))
-                    bl_str = f"({', '.join(baselines_found)})"
-                else:
-                    bl_str = ""
-                start_str = day_start.strftime("%Y-%m-%dT%H:%M:%SZ")
-                end_str = day_end.strftime("%Y-%m-%dT%H:%M:%SZ")
-                width = len(str(total_days))
-                logger.info(f"[{i+1:{width}d}/{total_days}] {start_str} -> {end_str}... found {len(urls)} {bl_str}")
-
-            yield urls
+        def search_day(day_start: datetime, day_end: datetime) -> list[str]:
+            search = client.search(
+                collections=[collection],
+                filter=filter_str,
+                filter_lang="cql2-text",
+                datetime=to_stac_datetime(day_start, day_end),
+                method="GET",
+                max_items=max_items,
+            )
+            return self._clean_search_results(search, day_start, day_end, format=format)
+
+        # Up to `prefetch` days are searched ahead on the pool; results are
+        # consumed in day order. If the consumer stops early, queued
+        # searches are cancelled.
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, prefetch), thread_name_prefix="maap-search-day"
+        )
+        pending: deque[Future[list[str]]] = deque()
+        upcoming = iter(day_ranges)
+        try:
+            for i, (day_start, day_end) in enumerate(day_ranges):
+                while len(pending) < max(1, prefetch) and (day := next(upcoming, None)):
+                    pending.append(executor.submit(search_day, *day))
+                try:
+                    urls = pending.popleft().result()
+                except (AuthenticationError, CredentialsError):
+                    raise
+                except Exception as e:
+                    # Transport retries are exhausted: skip the day, keep the range.
+                    logger.warning(f"FAILED DAY {day_start.date().isoformat()}: {e}")
+                    failed_ranges.append((day_start, day_end))
+                    self.last_failed_days.append((day_start.date(), str(e)))
+                    continue
+
+                if verbose:
+                    # Show baselines found by extracting from results
+                    if baseline:
+                        bl_str = f"({baseline.upper()})"
+                    elif urls:
+                        baselines_found = sorted(set(
+                            extract_baseline(os.path.basename(url)) or "?"
+                            for url in urls
+                        ))
+                        bl_str = f"({', '.join(baselines_found)})"
+                    else:
+                        bl_str = ""
+                    start_str = day_start.strftime("%Y-%m-%dT%H:%M:%SZ")
+                    end_str = day_end.strftime("%Y-%m-%dT%H:%M:%SZ")
+                    width = len(str(total_days))
+                    logger.info(f"[{i+1:{width}d}/{total_days}] {start_str} -> {end_str}... found {len(urls)} {bl_str}")
+
+                yield urls
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Second pass: retry each failed day once. By the time a long range
         # finishes, transient blips have usually passed; only days failing
@@ -696,18 +723,8 @@ class MaapSearcher:
             logger.info(f"Retrying {len(failed_ranges)} failed day(s)...")
             self.last_failed_days = []
             for day_start, day_end in failed_ranges:
-                datetime_arg = to_stac_datetime(day_start, day_end)
-                filter_str = self._build_filter(product_type, baseline=baseline, frames=frames)
                 try:
-                    search = self.client.search(
-                        collections=[collection],
-                        filter=filter_str,
-                        filter_lang="cql2-text",
-                        datetime=datetime_arg,
-                        method="GET",
-                        max_items=max_items,
-                    )
-                    urls = self._clean_search_results(search, day_start, day_end, format=format)
+                    urls = search_day(day_start, day_end)
                 except (AuthenticationError, CredentialsError):
                     raise
                 except Exception as e:
@@ -1,10 +1,12 @@
 """Text-file based state tracking for download workflows."""
 
+from contextlib import contextmanager
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 import logging
 import os
+import time
 
 from maap_client.paths import extract_sensing_time, filter_by_sensing_time, url_to_local_path
 from maap_client.registry import Registry
@@ -120,14 +122,15 @@ class StateTracker:
         filtered_urls = filter_by_sensing_time(list(url_to_pair.keys()), start, end)
         return [url_to_pair[url] for url in filtered_urls]
 
-    def add_urls(self, urls: list[str]) -> int:
+    def add_urls(self, urls: Iterable[str]) -> int:
         """
         Add multiple URLs, organizing by sensing date.
 
         Format: URL|PATH
 
         Args:
-            urls: List of product URLs
+            urls: Product URLs; any iterable, consumed in a single pass, so
+                  a generator is never materialized as a list first
 
         Returns:
             Number of new URLs added
@@ -166,6 +169,23 @@ class StateTracker:
 
         return new_count
 
+    def _download_record(self, url: str, local_path: Optional[Path]) -> Optional[tuple[date, str]]:
+        """Sensing date and URL|PATH line for a download (None if the date is unknown)."""
+        dt = extract_sensing_time(url)
+        if dt is None:
+            logger.warning(f"Could not extract date from URL: {url}")
+            return None
+
+        # Use provided path or compute from URL
+        path_str = ""
+        if local_path:
+            path_str = str(local_path)
+        elif self._data_dir:
+            computed = url_to_local_path(url, self._data_dir, self._mission, self._collection)
+            if computed:
+                path_str = str(computed)
+        return dt.date(), f"{url}|{path_str}"
+
     def mark_downloaded(self, url: str, local_path: Optional[Path] = None) -> bool:
         """
         Mark a URL as successfully downloaded.
@@ -180,24 +200,39 @@ class StateTracker:
         Returns:
             True if marked successfully, False if date cannot be extracted
         """
-        dt = extract_sensing_time(url)
-        if dt is None:
-            logger.warning(f"Could not extract date from URL: {url}")
+        record = self._download_record(url, local_path)
+        if record is None:
             return False
-        sensing_date = dt.date()
+        sensing_date, line = record
+        self._registry.append_line(self._dwl_file_for_date(sensing_date), line)
+        return True
 
-        # Use provided path or compute from URL
-        path_str = ""
-        if local_path:
-            path_str = str(local_path)
-        elif self._data_dir:
-            computed = url_to_local_path(url, self._data_dir, self._mission, self._collection)
-            if computed:
-                path_str = str(computed)
+    @contextmanager
+    def transaction(self, flush_every: int = 100, flush_interval: float = 10.0) -> Iterator["DownloadBatch"]:
+        """
+        Buffer download records and append them in groups.
 
-        dwl_file = self._dwl_file_for_date(sensing_date)
-        self._registry.append_line(dwl_file, f"{url}|{path_str}")
-        return True
+        Yields a DownloadBatch whose mark_downloaded replaces the tracker's:
+        instead of opening a dwl file per download, records are appended one
+        write per date file once flush_every have accumulated or
+        flush_interval seconds have passed, and on exit (also on error).
+        Records still buffered at a crash are not lost for good: the files
+        are on disk, so the next batch finds them existing and marks them
+        again. Reads see buffered records only after a flush.
+
+        The buffer belongs to the transaction, not the tracker, so threads
+        sharing a tracker (see GlobalStateTracker.get_tracker) can each run
+        their own; a single transaction is meant for one thread.
+
+        Args:
+            flush_every: Records buffered before a flush
+            flush_interval: Seconds after which the next record triggers a flush
+        """
+        batch = DownloadBatch(self, flush_every, flush_interval)
+        try:
+            yield batch
+        finally:
+            batch.flush()
 
     def mark(self, path: str) -> bool:
         """
@@ -221,6 +256,35 @@ class StateTracker:
         self._registry.append_line(mrk_file, path)
         return True
 
+    def mark_many(self, paths: Iterable[str]) -> tuple[int, list[str]]:
+        """
+        Mark several files as processed.
+
+        Same as mark() per path, but each date's marked file is opened and
+        appended to once.
+
+        Args:
+            paths: Local file paths
+
+        Returns:
+            Tuple of (number marked, paths whose date cannot be extracted)
+        """
+        paths_by_date: dict[date, list[str]] = {}
+        failed = []
+        for path in paths:
+            dt = extract_sensing_time(path)  # Extracts basename internally
+            if dt is None:
+                logger.warning(f"Could not extract date from path: {path}")
+                failed.append(path)
+                continue
+            paths_by_date.setdefault(dt.date(), []).append(path)
+
+        marked = 0
+        for sensing_date, date_paths in paths_by_date.items():
+            self._registry.append_lines(self._mrk_file_for_date(sensing_date), date_paths)
+            marked += len(date_paths)
+        return marked, failed
+
     def mark_error(self, url: str, error: str) -> None:
         """
         Record a download error.
@@ -412,6 +476,44 @@ class StateTracker:
         return sorted(dates)
 
 
+class DownloadBatch:
+    """Download records buffered by StateTracker.transaction()."""
+
+    def __init__(self, tracker: StateTracker, flush_every: int, flush_interval: float):
+        self._tracker = tracker
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._buffered: dict[Path, list[str]] = {}
+        self._count = 0
+        self._last_flush = time.monotonic()
+
+    def mark_downloaded(self, url: str, local_path: Optional[Path] = None) -> bool:
+        """Same as StateTracker.mark_downloaded, but buffered."""
+        record = self._tracker._download_record(url, local_path)
+        if record is None:
+            return False
+        sensing_date, line = record
+
+        # append_lines creates the directory when the buffer is flushed
+        dwl_file = self._tracker._registry.dwl_file_for_date(sensing_date)
+        self._buffered.setdefault(dwl_file, []).append(line)
+        self._count += 1
+        if (
+            self._count >= self._flush_every
+            or time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Append the buffered records to their dwl files."""
+        buffered, self._buffered = self._buffered, {}
+        self._count = 0
+        self._last_flush = time.monotonic()
+        for dwl_file, lines in buffered.items():
+            self._tracker._registry.append_lines(dwl_file, lines)
+
+
 class GlobalStateTracker:
     """
     Manager for accessing state trackers across collections/products.
@@ -429,6 +531,7 @@ class GlobalStateTracker:
         self._registry_dir = registry_dir
         self._mission = mission
         self._data_dir = data_dir
+        self._trackers: dict[tuple[str, str, str], StateTracker] = {}
 
     def get_tracker(
         self,
@@ -445,16 +548,23 @@ class GlobalStateTracker:
             baseline: Baseline version
 
         Returns:
-            StateTracker instance
-        """
-        return StateTracker(
-            registry_dir=self._registry_dir,
-            mission=self._mission,
-            collection=collection,
-            product_type=product_type,
-            baseline=baseline,
-            data_dir=self._data_dir,
-        )
+            StateTracker instance (shared per key, so reuse skips re-creating
+            directories). Trackers hold no mutable state beyond their paths:
+            transaction() keeps its buffer in the DownloadBatch it yields, so
+            threads sharing a tracker never share a buffer.
+        """
+        key = (collection, product_type, baseline)
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = self._trackers[key] = StateTracker(
+                registry_dir=self._registry_dir,
+                mission=self._mission,
+                collection=collection,
+                product_type=product_type,
+                baseline=baseline,
+                data_dir=self._data_dir,
+            )
+        return tracker
 
     def list_tracked(self) -> list[tuple[str, str, str]]:
         """
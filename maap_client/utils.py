@@ -1,5 +1,6 @@
 """Utility functions for MAAP client."""
 
+import functools
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -67,6 +68,12 @@ def parse_datetime(dt_str: str) -> datetime:
         return datetime.strptime(dt_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
 
 
+@functools.lru_cache(maxsize=16)
+def parse_mission_range(mission_start: str, mission_end: str) -> tuple[datetime, datetime]:
+    """Parse configured mission start/end strings (memoized: configs rarely change)."""
+    return parse_datetime(mission_start), parse_datetime(mission_end)
+
+
 def normalize_time_range(
     start: Optional[datetime],
     end: Optional[datetime],